@@ -2,16 +2,42 @@
 
 import os
 import time
+import struct
 import logging
 from typing import Dict, List, Optional, Tuple, Union
+from PyQt6.QtCore import QObject, pyqtSignal
 from hardware.ch341_py_smbus import CH341  # Import the Python SMBus implementation
+from utils.trace import trace, TAG_READ, TAG_WRITE, TAG_RETRY
 
-class CH341Manager:
+# Report progress every this many bytes during reads and writes
+PROGRESS_INTERVAL = 256
+
+# Progress (percent) at the start of each verify read-back after a write,
+# and at the end of the last one
+VERIFY_PROGRESS = (50, 90, 95, 100)
+
+# Big-endian 16-bit memory address (high byte first)
+ADDR16 = struct.Struct('>H')
+
+class CH341Manager(QObject):
     """Manager for CH341 USB-to-I2C adapter communication"""
     
+    # Emitted with the new state whenever the adapter connects or disconnects
+    connection_changed = pyqtSignal(bool)
+    
+    # Recent detect_eeprom() results keyed by device: {key: (timestamp, info)}
+    _detect_cache = {}
+    DETECT_CACHE_TTL = 2.0  # seconds
+    
+    # Shared page of erased bytes; erase slices pages from it instead of
+    # building a buffer the size of the whole EEPROM
+    _FF_PAGE = b'\xff' * 64
+    
     def __init__(self, logger):
+        super().__init__()
         self.logger = logger
         self.device = None
+        self.device_key = None
         self.eeprom_size = None
         self.i2c_speed = None
         self.connected = False
@@ -21,6 +47,38 @@ class CH341Manager:
         """Check if connected to CH341"""
         return self.connected
         
+    def check_adapter(self):
+        """Check that the adapter is still attached, disconnecting if it is gone
+        
+        Sends a USB GET_STATUS request, which doesn't touch the I2C bus.
+        
+        Returns:
+            bool: True if the adapter responded
+        """
+        if not self.connected or not self.device:
+            return False
+            
+        try:
+            self.device.dev.ctrl_transfer(0x80, 0x00, 0, 0, 2)  # Standard GET_STATUS
+            return True
+        except Exception as e:
+            self.logger.warning(f"CH341 adapter not responding: {str(e)}")
+            self.disconnect()
+            return False
+            
+    def _detect_with_retry(self, addr, retries=3, delay_s=0.01):
+        """Check for a device at addr, retrying a few times before giving up
+        
+        Returns as soon as one attempt succeeds. The CH341 answers within a
+        couple of USB frames, so a short delay between attempts suffices.
+        """
+        for attempt in range(retries):
+            if self.device.detect(addr):
+                return True
+            if attempt < retries - 1:
+                time.sleep(delay_s)
+        return False
+        
     def scan_i2c_bus(self):
         """Scan I2C bus for devices"""
         if not self.device:
@@ -30,18 +88,24 @@ class CH341Manager:
         eeprom_addresses = [0x50, 0x51, 0x52, 0x53, 0x54, 0x55, 0x56, 0x57]
         found_addresses = []
         
-        for addr in eeprom_addresses:
-            try:
-                # Multiple detection attempts with delays
-                for attempt in range(3):
-                    if self.device.detect(addr):
-                        found_addresses.append(addr)
-                        self.logger.info(f"Found device at address 0x{addr:02X}")
-                        break
-                    time.sleep(0.01)  # 10ms delay between attempts
-            except Exception as e:
-                self.logger.debug(f"Scan error at address 0x{addr:02X}: {str(e)}")
-                continue
+        # Sweep every address once per pass and only retry the sweep if
+        # nothing answered, instead of retrying each absent address
+        for attempt in range(3):
+            for addr in eeprom_addresses:
+                try:
+                    present = self.device.detect(addr)
+                except Exception as e:
+                    if self.logger.isEnabledFor(logging.DEBUG):
+                        self.logger.debug("Scan error at address 0x%02X: %s", addr, e)
+                    continue
+                if present:
+                    found_addresses.append(addr)
+                    self.logger.info("Found device at address 0x%02X", addr)
+                    
+            if found_addresses:
+                break
+            if attempt < 2:
+                time.sleep(0.01)
                 
         return found_addresses
         
@@ -51,13 +115,11 @@ class CH341Manager:
             return None
             
         try:
-            # Try reading first byte with different addressing modes
-            data = self.read_test_patterns(addr)
-            if not data:
+            # Determine the memory size from address wrap-around
+            size = self.probe_size(addr)
+            if not size:
                 return None
                 
-            # Analyze memory access patterns
-            size = len(data)
             if size >= 4096:  # 32Kbit or larger
                 return "24C32"
             elif size >= 2048:  # 16Kbit
@@ -72,51 +134,68 @@ class CH341Manager:
                 return "24C01"
                 
         except Exception as e:
-            self.logger.debug(f"EEPROM type detection error: {str(e)}")
+            self.logger.debug("EEPROM type detection error: %s", e)
             
         return None
         
-    def read_test_patterns(self, addr):
-        """Read test patterns to determine EEPROM size"""
-        try:
-            # Try reading with 8-bit addressing
-            data = bytearray()
-            chunk_size = 8
+    def probe_size(self, addr):
+        """Determine EEPROM size by probing for address wrap-around
+        
+        Writes a sentinel at offset 0 and another at each power-of-two
+        offset. If the second sentinel shows up at offset 0 the address
+        wrapped and the device is smaller than that offset. Offsets above
+        256 bytes select the memory block through the low I2C address bits
+        (24C04-24C16); a block that does not acknowledge ends the probe.
+        The original bytes are restored before returning.
+        
+        Args:
+            addr (int): I2C address of the EEPROM
             
-            # Test different address ranges
-            test_sizes = [128, 256, 512, 1024, 2048, 4096]
+        Returns:
+            int: Size in bytes, or None if the device could not be read
+        """
+        original = self._read_byte_8bit(addr, 0)
+        if original is None:
+            return None
             
-            for size in test_sizes:
-                try:
-                    # Try reading beyond current size
-                    addr_high = (size - chunk_size) >> 8
-                    addr_low = (size - chunk_size) & 0xFF
+        try:
+            self._write_byte_8bit(addr, 0, 0x55)
+            if self._read_byte_8bit(addr, 0) != 0x55:
+                # Ignores 8-bit word addresses: 16-bit addressed part
+                return 4096
+                
+            for k in range(7, 11):
+                offset = 1 << k
+                if not self.device.detect(addr | (offset >> 8)):
+                    return offset
                     
-                    # Multiple read attempts with delays
-                    for attempt in range(3):
-                        try:
-                            if size > 2048:  # Use 16-bit addressing
-                                self.device.write_i2c_block_data(addr, addr_high, [addr_low])
-                            else:  # Use 8-bit addressing
-                                self.device.write_i2c_block_data(addr, addr_low, [])
-                                
-                            time.sleep(0.002)  # 2ms delay
-                            chunk = self.device.read_i2c_block_data(addr, None, chunk_size)
-                            
-                            if chunk is not None:
-                                data.extend(chunk)
-                                break
-                        except Exception:
-                            if attempt < 2:
-                                time.sleep(0.01)  # 10ms delay between attempts
-                            
-                except Exception:
-                    return data
+                saved = self._read_byte_8bit(addr, offset)
+                if saved is None:
+                    return None  # Can't restore what couldn't be read
                     
-            return data
+                try:
+                    self._write_byte_8bit(addr, offset, 0xAA)
+                    wrapped = self._read_byte_8bit(addr, 0) == 0xAA
+                finally:
+                    self._write_byte_8bit(addr, offset, saved)
+                if wrapped:
+                    return offset
+                    
+            # Largest size reachable with 8-bit word addresses
+            return 2048
             
-        except Exception:
-            return None
+        finally:
+            self._write_byte_8bit(addr, 0, original)
+            
+    def _read_byte_8bit(self, addr, offset):
+        """Read one byte using an 8-bit word address plus block select bits"""
+        data = self.device.write_then_read(addr | (offset >> 8), [offset & 0xFF], 1)
+        return data[0] if data else None
+        
+    def _write_byte_8bit(self, addr, offset, value):
+        """Write one byte using an 8-bit word address plus block select bits"""
+        self.device.write_i2c_block_data(addr | (offset >> 8), offset & 0xFF, [value])
+        time.sleep(0.005)  # 5ms write cycle delay
             
     def connect(self, eeprom_size, i2c_speed):
         """Connect to CH341 device"""
@@ -134,12 +213,21 @@ class CH341Manager:
                 self.logger.error(f"CH341 device not found: {str(e)}")
                 return False
                 
+            # Identify the adapter for the detection cache
+            try:
+                serial = self.device.dev.serial_number
+            except Exception:
+                serial = None
+            self.device_key = serial or id(self.device)
+            self._detect_cache.pop(self.device_key, None)
+            
             # Store configuration
             self.eeprom_size = eeprom_size
             self.i2c_speed = i2c_speed
             self.connected = True
             
             self.logger.info(f"Connected to CH341 with {i2c_speed['name']}")
+            self.connection_changed.emit(True)
             return True
             
         except Exception as e:
@@ -151,12 +239,17 @@ class CH341Manager:
         """Disconnect from CH341 device"""
         try:
             if self.connected and self.device:
+                # Drop cached detection results for this adapter
+                self._detect_cache.pop(self.device_key, None)
+                self.device_key = None
+                
                 # Release USB device
                 self.device.dev = None
                 self.device = None
                 self.connected = False
                 self.eeprom_addr = None
                 self.logger.info("Disconnected from CH341")
+                self.connection_changed.emit(False)
             return True
         except Exception as e:
             self.logger.error(f"Failed to disconnect from CH341: {str(e)}")
@@ -168,6 +261,12 @@ class CH341Manager:
             self.logger.error("Not connected to CH341")
             return None
             
+        # Reuse a recent result for this adapter
+        cached = self._detect_cache.get(self.device_key)
+        if cached and time.time() - cached[0] < self.DETECT_CACHE_TTL:
+            self.eeprom_addr = cached[1]["address"]
+            return cached[1]
+            
         try:
             # Multiple detection attempts
             for attempt in range(3):
@@ -198,11 +297,13 @@ class CH341Manager:
                         else:
                             size = 128
                             
-                        return {
+                        info = {
                             "type": detected_type,
                             "size": size,
                             "address": self.eeprom_addr
                         }
+                        self._detect_cache[self.device_key] = (time.time(), info)
+                        return info
                 
                 if attempt < 2:
                     time.sleep(0.1)  # 100ms delay between attempts
@@ -214,74 +315,76 @@ class CH341Manager:
             self.logger.error(f"Failed to detect EEPROM: {str(e)}")
             return None
             
-    def read_eeprom(self):
-        """Read EEPROM contents"""
+    def read_eeprom(self, progress_callback=None):
+        """Read EEPROM contents
+        
+        Args:
+            progress_callback (callable): Optional, called with the completed
+                percentage (0-100) while reading
+        """
         if not self.connected or not self.device:
             self.logger.error("Not connected to CH341")
             return None
             
         try:
-            data = bytearray()
-            chunk_size = 8  # Reduced chunk size for better reliability
+            chunk_size = 32  # Largest transfer the CH341 handles in one packet
             total_size = self.eeprom_size["bytes"]
             
-            # Multiple detection attempts
-            for attempt in range(3):
-                # Test EEPROM presence before reading
-                if self.device.detect(self.eeprom_addr):
-                    break
-                time.sleep(0.1)  # 100ms delay between attempts
-            else:
+            # Preallocate the result and copy chunks straight into place
+            data = bytearray(total_size)
+            view = memoryview(data)
+            
+            # Test EEPROM presence before reading
+            if not self._detect_with_retry(self.eeprom_addr):
                 self.logger.error(f"EEPROM not responding at address 0x{self.eeprom_addr:02X}")
                 return None
                 
             # For larger EEPROMs (>2KB), we need to handle the high address byte
-            use_16bit_addr = total_size > 2048
+            addr_width = 2 if total_size > 2048 else 1
             
-            # Read EEPROM in small chunks with proper delays
+            # Read EEPROM in chunks; each chunk sets its address and reads it
+            # back in a single combined write-then-read transfer
             for base_addr in range(0, total_size, chunk_size):
-                try:
-                    # Multiple read attempts for each chunk
-                    for attempt in range(3):
-                        try:
-                            # Send current address with proper format
-                            if use_16bit_addr:
-                                # For 16-bit addressing
-                                high_addr = (base_addr >> 8) & 0xFF
-                                low_addr = base_addr & 0xFF
-                                self.device.write_i2c_block_data(self.eeprom_addr, high_addr, [low_addr])
-                            else:
-                                # For 8-bit addressing
-                                self.device.write_i2c_block_data(self.eeprom_addr, base_addr & 0xFF, [])
-                            
-                            time.sleep(0.002)  # 2ms delay after address write
-                            
-                            chunk = self.device.read_i2c_block_data(self.eeprom_addr, None, chunk_size)
-                            if chunk is not None:
-                                data.extend(chunk)
-                                break
-                        except Exception as e:
-                            self.logger.debug(f"Read retry {attempt + 1} failed at 0x{base_addr:04X}: {str(e)}")
-                            if attempt < 2:
-                                time.sleep(0.01)  # 10ms delay between retries
-                    else:
-                        self.logger.error(f"Failed to read EEPROM at address 0x{base_addr:04X} after 3 retries")
-                        return None
-                        
-                    time.sleep(0.001)  # 1ms delay between chunks
-                    
-                except Exception as e:
-                    self.logger.error(f"Error reading at address 0x{base_addr:04X}: {str(e)}")
+                length = min(chunk_size, total_size - base_addr)
+                
+                if progress_callback and base_addr % PROGRESS_INTERVAL == 0:
+                    progress_callback(base_addr * 100 // total_size)
+                
+                # Multiple read attempts for each chunk
+                for attempt in range(3):
+                    try:
+                        chunk = self.device.read_range(self.eeprom_addr, base_addr, length, addr_width)
+                        if chunk is not None:
+                            view[base_addr:base_addr + length] = chunk
+                            trace(TAG_READ, base_addr, length)
+                            break
+                    except Exception as e:
+                        trace(TAG_RETRY, base_addr, attempt + 1)
+                        self.logger.debug("Read retry %d failed at 0x%04X: %s", attempt + 1, base_addr, e)
+                    if attempt < 2:
+                        time.sleep(0.01)  # 10ms delay between retries
+                else:
+                    self.logger.error(f"Failed to read EEPROM at address 0x{base_addr:04X} after 3 retries")
                     return None
                     
+            view.release()
+            if progress_callback:
+                progress_callback(100)
             return data
             
         except Exception as e:
             self.logger.error(f"Failed to read EEPROM: {str(e)}")
             return None
             
-    def write_eeprom(self, data):
-        """Write data to EEPROM"""
+    def write_eeprom(self, data, progress_callback=None):
+        """Write data to EEPROM
+        
+        Args:
+            data (bytes, bytearray or memoryview): Data to write, starting
+                at address 0
+            progress_callback (callable): Optional, called with the completed
+                percentage (0-100) while writing
+        """
         if not self.connected or not self.device:
             self.logger.error("Not connected to CH341")
             return False
@@ -291,110 +394,180 @@ class CH341Manager:
                 self.logger.error(f"Data size ({len(data)} bytes) exceeds EEPROM size ({self.eeprom_size['bytes']} bytes)")
                 return False
                 
-            # Multiple detection attempts
-            for attempt in range(3):
-                # Test EEPROM presence before writing
-                if self.device.detect(self.eeprom_addr):
-                    break
-                time.sleep(0.1)  # 100ms delay between attempts
-            else:
+            # Test EEPROM presence before writing
+            if not self._detect_with_retry(self.eeprom_addr):
                 self.logger.error(f"EEPROM not responding at address 0x{self.eeprom_addr:02X}")
                 return False
                 
-            # Use the EEPROM's page size for writing
-            page_size = min(self.eeprom_size["page_size"], 8)  # Limit to 8 bytes for reliability
-            total_size = self.eeprom_size["bytes"]
-            use_16bit_addr = total_size > 2048
+            expected = bytes(data)
+            view = memoryview(expected)  # Pages are zero-copy slices
+            return self._write_pages(len(expected),
+                                     lambda offset, length: view[offset:offset + length],
+                                     lambda readback, page_size: self._mismatched_pages(
+                                         expected, readback, page_size),
+                                     progress_callback)
             
-            # Write EEPROM in pages
-            for base_addr in range(0, len(data), page_size):
-                # Calculate actual bytes to write
-                chunk_size = min(page_size, len(data) - base_addr)
-                chunk = data[base_addr:base_addr + chunk_size]
+        except Exception as e:
+            self.logger.error(f"Failed to write EEPROM: {str(e)}")
+            return False
+            
+    def _write_pages(self, total_length, get_page, find_bad_pages, progress_callback=None):
+        """Write and verify total_length bytes starting at address 0
+        
+        Args:
+            total_length (int): Number of bytes to write
+            get_page (callable): Called as get_page(offset, length) and
+                returns the bytes to write at that offset
+            find_bad_pages (callable): Called as find_bad_pages(readback,
+                page_size) with the first total_length bytes read back;
+                returns the start offsets of pages that need rewriting
+            progress_callback (callable): Optional, called with the completed
+                percentage (0-100); writing reports 0-50, the first read-back
+                50-90 and the retries the rest
+        """
+        # Use the EEPROM's page size for writing
+        page_size = min(self.eeprom_size["page_size"], 8)  # Limit to 8 bytes for reliability
+        use_16bit_addr = self.eeprom_size["bytes"] > 2048
+        
+        # Write EEPROM in pages
+        for base_addr in range(0, total_length, page_size):
+            if progress_callback and base_addr % PROGRESS_INTERVAL == 0:
+                progress_callback(base_addr * 50 // total_length)
                 
-                try:
-                    if use_16bit_addr:
-                        high_addr = (base_addr >> 8) & 0xFF
-                        low_addr = base_addr & 0xFF
-                        addr_bytes = [high_addr, low_addr]
-                    else:
-                        addr_bytes = [base_addr & 0xFF]
-                    
-                    # Write page with retry
-                    for retry in range(3):
-                        try:
-                            # Write address and data
-                            self.device.write_i2c_block_data(self.eeprom_addr, addr_bytes[0], 
-                                                           (addr_bytes[1:] if len(addr_bytes) > 1 else []) + list(chunk))
-                            
-                            time.sleep(0.005)  # 5ms write cycle delay
-                            
-                            # Verify written data
-                            self.device.write_i2c_block_data(self.eeprom_addr, addr_bytes[0], addr_bytes[1:] if len(addr_bytes) > 1 else [])
-                            time.sleep(0.002)  # 2ms delay before read
-                            readback = self.device.read_i2c_block_data(self.eeprom_addr, None, chunk_size)
-                            
-                            if readback == list(chunk):
-                                break
-                        except Exception as e:
-                            self.logger.debug(f"Write retry {retry + 1} failed at 0x{base_addr:04X}: {str(e)}")
-                            if retry < 2:
-                                time.sleep(0.01)  # 10ms delay between retries
-                    else:
-                        self.logger.error(f"Failed to verify write at address 0x{base_addr:04X}")
-                        return False
-                    
-                except Exception as e:
-                    self.logger.error(f"Error writing at address 0x{base_addr:04X}: {str(e)}")
+            chunk = get_page(base_addr, min(page_size, total_length - base_addr))
+            if not self._write_page(chunk, base_addr, use_16bit_addr):
+                return False
+                
+        # Verify with a single read-back and rewrite only the pages
+        # that did not take; every rewrite is followed by another read-back
+        for attempt in range(3):
+            readback_progress = None
+            if progress_callback:
+                # Scale each read-back into its own slice so progress never goes back
+                low, high = VERIFY_PROGRESS[attempt], VERIFY_PROGRESS[attempt + 1]
+                readback_progress = (lambda percent, low=low, high=high:
+                                     progress_callback(low + percent * (high - low) // 100))
+                                     
+            readback = self.read_eeprom(readback_progress)
+            if readback is None:
+                return False
+                
+            bad_pages = find_bad_pages(readback[:total_length], page_size)
+            if not bad_pages:
+                if progress_callback:
+                    progress_callback(100)
+                return True
+            if attempt == 2:
+                break
+                
+            for base_addr in bad_pages:
+                self.logger.debug("Verify failed, rewriting page at 0x%04X", base_addr)
+                chunk = get_page(base_addr, min(page_size, total_length - base_addr))
+                if not self._write_page(chunk, base_addr, use_16bit_addr):
                     return False
                     
-            return True
+        self.logger.error(f"Failed to verify write at address 0x{bad_pages[0]:04X}")
+        return False
             
-        except Exception as e:
-            self.logger.error(f"Failed to write EEPROM: {str(e)}")
-            return False
+    def _write_page(self, chunk, base_addr, use_16bit_addr):
+        """Write one page of data (bytes) starting at base_addr, retrying on errors"""
+        if use_16bit_addr:
+            addr_bytes = ADDR16.pack(base_addr & 0xFFFF)
+        else:
+            addr_bytes = bytes((base_addr & 0xFF,))
+            
+        # Low address byte (if any) followed by the page data
+        payload = addr_bytes[1:] + chunk
+        
+        # Write page with retry
+        for retry in range(3):
+            try:
+                # Write address and data
+                self.device.write_i2c_block_data(self.eeprom_addr, addr_bytes[0], payload)
+                trace(TAG_WRITE, base_addr, len(chunk))
+                
+                time.sleep(0.005)  # 5ms write cycle delay
+                return True
+            except Exception as e:
+                trace(TAG_RETRY, base_addr, retry + 1)
+                self.logger.debug("Write retry %d failed at 0x%04X: %s", retry + 1, base_addr, e)
+                if retry < 2:
+                    time.sleep(0.01)  # 10ms delay between retries
+                    
+        self.logger.error(f"Error writing at address 0x{base_addr:04X}")
+        return False
+        
+    @staticmethod
+    def _first_mismatch(expected, actual):
+        """Return the offset of the first differing byte, or None if equal"""
+        if expected == actual:
+            return None
+        return next((i for i, (x, y) in enumerate(zip(expected, actual)) if x != y),
+                    min(len(expected), len(actual)))
+        
+    @staticmethod
+    def _mismatched_pages(expected, readback, page_size):
+        """Return the start offsets of pages whose readback differs from expected"""
+        # Compare as whole buffers; only scan pages from the first difference
+        first = CH341Manager._first_mismatch(expected, readback)
+        if first is None:
+            return []
+        return [base_addr for base_addr in range(first - first % page_size, len(expected), page_size)
+                if expected[base_addr:base_addr + page_size] != readback[base_addr:base_addr + page_size]]
+            
+    @staticmethod
+    def _unerased_pages(readback, page_size):
+        """Return the start offsets of pages in readback that are not all 0xFF"""
+        if not readback.strip(b'\xff'):
+            return []  # Fully erased
+        first = len(readback) - len(readback.lstrip(b'\xff'))
+        return [base_addr for base_addr in range(first - first % page_size, len(readback), page_size)
+                if readback[base_addr:base_addr + page_size].strip(b'\xff')]
             
-    def erase_eeprom(self):
-        """Erase EEPROM contents (fill with 0xFF)"""
+    def erase_eeprom(self, progress_callback=None):
+        """Erase EEPROM contents (fill with 0xFF)
+        
+        Args:
+            progress_callback (callable): Optional, called with the completed
+                percentage (0-100) while erasing
+        """
         if not self.connected or not self.device:
             self.logger.error("Not connected to CH341")
             return False
             
         try:
-            # Multiple detection attempts
-            for attempt in range(3):
-                # Test EEPROM presence before erasing
-                if self.device.detect(self.eeprom_addr):
-                    break
-                time.sleep(0.1)  # 100ms delay between attempts
-            else:
+            # Test EEPROM presence before erasing
+            if not self._detect_with_retry(self.eeprom_addr):
                 self.logger.error(f"EEPROM not responding at address 0x{self.eeprom_addr:02X}")
                 return False
                 
-            data = bytearray([0xFF] * self.eeprom_size["bytes"])
-            return self.write_eeprom(data)
+            ff_page = self._FF_PAGE
+            return self._write_pages(self.eeprom_size["bytes"],
+                                     lambda offset, length: ff_page[:length],
+                                     self._unerased_pages, progress_callback)
         except Exception as e:
             self.logger.error(f"Failed to erase EEPROM: {str(e)}")
             return False
             
-    def verify_eeprom(self, expected_data):
-        """Verify EEPROM contents match expected data"""
+    def verify_eeprom(self, expected_data, progress_callback=None):
+        """Verify EEPROM contents match expected data
+        
+        Args:
+            expected_data (bytes or bytearray): Data expected from address 0
+            progress_callback (callable): Optional, called with the completed
+                percentage (0-100) while reading back
+        """
         if not self.connected or not self.device:
             self.logger.error("Not connected to CH341")
             return False, 0
             
         try:
-            # Multiple detection attempts
-            for attempt in range(3):
-                # Test EEPROM presence before verifying
-                if self.device.detect(self.eeprom_addr):
-                    break
-                time.sleep(0.1)  # 100ms delay between attempts
-            else:
+            # Test EEPROM presence before verifying
+            if not self._detect_with_retry(self.eeprom_addr):
                 self.logger.error(f"EEPROM not responding at address 0x{self.eeprom_addr:02X}")
                 return False, 0
                 
-            current_data = self.read_eeprom()
+            current_data = self.read_eeprom(progress_callback)
             if not current_data:
                 return False, 0
                 
@@ -402,11 +575,13 @@ class CH341Manager:
                 self.logger.error(f"Expected data size ({len(expected_data)} bytes) exceeds EEPROM size ({len(current_data)} bytes)")
                 return False, 0
                 
-            for i in range(len(expected_data)):
-                if expected_data[i] != current_data[i]:
-                    return False, i
-                    
-            return True, 0
+            # Compare as whole buffers; only walk bytes when they differ
+            expected = bytes(expected_data)
+            current = bytes(current_data[:len(expected)])
+            mismatch = self._first_mismatch(expected, current)
+            if mismatch is None:
+                return True, 0
+            return False, mismatch
         except Exception as e:
             self.logger.error(f"Failed to verify EEPROM: {str(e)}")
             return False, 0
\ No newline at end of file
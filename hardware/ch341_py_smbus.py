@@ -125,76 +125,71 @@ class CH341():
 
 
     """
-    @brief Set I2C START Condition
+    @brief Check that every byte sent on the I2C bus has been acknowledged
 
-    @return None
-    """
-    def __start(self):
-        cmd = [VendorCmd.I2C, I2CCmd.STA, I2CCmd.END]
-        cnt = self.dev.write(self.EP_OUT, cmd)
-        if (cnt != len(cmd)):
-            raise ConnectionError("Failed to issue I2C START Command")
-
-
-    """
-    @brief Set I2C STOP Condition
-
-    @return None
-    """
-    def __stop(self):
-        cmd = [VendorCmd.I2C, I2CCmd.STO, I2CCmd.END]
-        cnt = self.dev.write(self.EP_OUT, cmd)
-        if (cnt != len(cmd)):
-            raise ConnectionError("Failed to issue I2C STOP Command")
-
-
-    """
-    @brief Check if a byte sent on the I2C bus has been acknowledged
+    @param count [in] number of bytes sent; one status byte is returned for each
     
-    @return bool: True for ACK, False for NAK
+    @return bool: True if all were ACKed, False on any NAK
     """
-    def __check_ack(self):
+    def __check_ack(self, count=1):
         rval = self.dev.read(self.EP_IN, I2CCmd.MAX)
-        if ((len(rval) != 1 ) or (rval[0] & 0x80)):
+        if len(rval) != count:
             return False
-        else:
-            return True
+        return all(not (status & 0x80) for status in rval)
 
 
     """
     @brief Write one or more bytes to I2C bus
+
+    Each byte is sent with its own OUT command, which clocks out exactly
+    one byte and reports its ACK. START, the bytes and STOP are queued in
+    as few USB packets as possible, checking the ACKs after each packet.
     
-    @param data [in] bytes to write (<=32)
+    @param data [in] byte or sequence of bytes to write
+    @param start [in] issue a START condition before the data
+    @param stop [in] issue a STOP condition after the data
 
     @return None
     """
-    def __write_bytes(self, data):
-        cmd = [VendorCmd.I2C, I2CCmd.OUT]
-        if type(data) is list:
-            for point in data:
-                cmd.append(point)
-        else:
-            cmd.append(data)
-        cmd.append(I2CCmd.END)
-        cnt = self.dev.write(self.EP_OUT, cmd)
-        if (cnt != len(cmd)):
-            raise ConnectionError("Failed to issue I2C Send Command")
-        if not (self.__check_ack()):
-            raise ConnectionError("I2C ACK not received")
+    def __write_bytes(self, data, start=False, stop=False):
+        if isinstance(data, int):
+            data = [data]
+        data = list(data)
+        # Room for the vendor command, START, STOP and END around OUT/byte pairs
+        per_packet = (I2CCmd.MAX - 4) // 2
+        for pos in range(0, len(data), per_packet):
+            chunk = data[pos:pos + per_packet]
+            cmd = [VendorCmd.I2C]
+            if start and pos == 0:
+                cmd.append(I2CCmd.STA)
+            for byte in chunk:
+                cmd += [I2CCmd.OUT, byte]
+            if stop and pos + per_packet >= len(data):
+                cmd.append(I2CCmd.STO)
+            cmd.append(I2CCmd.END)
+            cnt = self.dev.write(self.EP_OUT, cmd)
+            if (cnt != len(cmd)):
+                raise ConnectionError("Failed to issue I2C Send Command")
+            if not (self.__check_ack(len(chunk))):
+                raise ConnectionError("I2C ACK not received")
 
 
     """
     @brief Read one or more bytes from I2C bus
 
     @param length [in] number of bytes to read (<=32)
+    @param stop [in] issue a STOP condition after the read
 
     @return array: data read from bus
     """
-    def __read_bytes(self, length=1):
+    def __read_bytes(self, length=1, stop=False):
         if length <= 0 or length > I2CCmd.MAX:
             raise ValueError(f"Invalid read length: {length}")
             
-        cmd = [VendorCmd.I2C, I2CCmd.IN | length, I2CCmd.END]
+        cmd = [VendorCmd.I2C, I2CCmd.IN | length]
+        if stop:
+            cmd.append(I2CCmd.STO)
+        cmd.append(I2CCmd.END)
         cnt = self.dev.write(self.EP_OUT, cmd)
         if (cnt != len(cmd)):
             raise ConnectionError("Failed to issue I2C Receive Command")
@@ -220,9 +215,7 @@ class CH341():
     def detect(self, addr):
         rVal = True
         try:
-            self.__start()
-            self.__write_bytes(addr << 1)
-            self.__stop()
+            self.__write_bytes(addr << 1, start=True, stop=True)
         except ConnectionError as err:
             print(err)
             rVal = False
@@ -240,12 +233,11 @@ class CH341():
     """
     def write_byte_data(self, addr, off, byte):
         try:
-            self.__start()
-            self.__write_bytes(addr << 1)
+            payload = [addr << 1]
             if off is not None:
-                self.__write_bytes(off)
-            self.__write_bytes(byte)
-            self.__stop()
+                payload.append(off)
+            payload.append(byte)
+            self.__write_bytes(payload, start=True, stop=True)
         except ConnectionError as err:
             print(err)
 
@@ -261,17 +253,14 @@ class CH341():
     def read_byte_data(self, addr, off):
         rval = None
         try:
-            self.__start()
-            self.__write_bytes(addr << 1)
+            payload = [addr << 1]
             if off is not None:
-                self.__write_bytes(off)
-            self.__stop()
-            self.__start()
-            self.__write_bytes((addr << 1) | 1)
-            rval = self.__read_bytes()
+                payload.append(off)
+            self.__write_bytes(payload, start=True, stop=True)
+            self.__write_bytes((addr << 1) | 1, start=True)
+            rval = self.__read_bytes(stop=True)
             if rval is not None:
                 rval = rval[0]
-            self.__stop()
         except ConnectionError as err:
             print(err)
         return rval
@@ -282,18 +271,17 @@ class CH341():
     
     @param addr [in] I2C address to read from
     @param off [in] register to start reading from
-    @param data [in] array of bytes to write
+    @param data [in] array of bytes to write (list, bytes or memoryview)
 
     @return None
     """
     def write_i2c_block_data(self, addr, off, data):
         try:
-            self.__start()
-            self.__write_bytes(addr << 1)
+            payload = [addr << 1]
             if off is not None:
-                self.__write_bytes(off)
-            self.__write_bytes(data)
-            self.__stop()
+                payload.append(off)
+            payload.extend(data)
+            self.__write_bytes(payload, start=True, stop=True)
         except ConnectionError as err:
             print(err)
 
@@ -313,19 +301,91 @@ class CH341():
             return None
             
         try:
-            self.__start()
-            self.__write_bytes(addr << 1)
+            payload = [addr << 1]
             if off is not None:
-                self.__write_bytes(off)
-            self.__stop()
-            self.__start()
-            self.__write_bytes((addr << 1) | 1)
-            rval = self.__read_bytes(length)
-            self.__stop()
-            return rval
+                payload.append(off)
+            self.__write_bytes(payload, start=True, stop=True)
+            self.__write_bytes((addr << 1) | 1, start=True)
+            return self.__read_bytes(length, stop=True)
+        except ConnectionError as err:
+            print(err)
+            return None
+
+
+    """
+    @brief Write bytes then read back from an I2C device in one USB packet
+
+    Issues START, the write segment, a repeated START and the read segment
+    followed by STOP as a single bulk OUT, so there is no host round-trip
+    between setting a register/memory pointer and reading from it. Both
+    address bytes are sent with a bare OUT so the device's ACK is reported
+    ahead of the data read.
+
+    @param addr [in] I2C address to access
+    @param write_bytes [in] bytes to write before reading (e.g. memory address),
+                            list or bytes
+    @param read_len [in] number of bytes to read, <=32
+
+    @return array: bytes read from bus, or None if the device did not ACK
+    """
+    def write_then_read(self, addr, write_bytes, read_len):
+        if read_len <= 0 or read_len > I2CCmd.MAX:
+            print(f"Invalid read length: {read_len}")
+            return None
+
+        cmd = [VendorCmd.I2C, I2CCmd.STA, I2CCmd.OUT, addr << 1]
+        if write_bytes:
+            cmd.append(I2CCmd.OUT | len(write_bytes))
+            cmd.extend(write_bytes)
+        cmd += [I2CCmd.STA, I2CCmd.OUT, (addr << 1) | 1,
+                I2CCmd.IN | read_len, I2CCmd.STO, I2CCmd.END]
+
+        try:
+            cnt = self.dev.write(self.EP_OUT, cmd)
+            if (cnt != len(cmd)):
+                raise ConnectionError("Failed to issue I2C Write-Read Command")
+            # One status byte per address byte, then the data
+            rval = self.dev.read(self.EP_IN, read_len + 2)
+            if len(rval) != read_len + 2:
+                raise ConnectionError("I2C Received an incorrect number of bytes")
+            if (rval[0] & 0x80) or (rval[1] & 0x80):
+                raise ConnectionError("I2C ACK not received")
+            return list(rval[2:])
         except ConnectionError as err:
             print(err)
             return None
+        except usb.core.USBError as e:
+            print(f"USB read error: {str(e)}")
+            return None
+
+
+    """
+    @brief Read a range of memory from an I2C memory device (e.g. EEPROM)
+
+    Each transfer of up to 32 bytes is a single write-then-read USB packet
+    carrying its own memory address, so no separate address-setup
+    transaction is needed.
+
+    @param addr [in] I2C address of the memory device
+    @param mem_addr [in] memory address to start reading from
+    @param length [in] number of bytes to read
+    @param addr_bytes [in] width of the memory address: 1 or 2 bytes
+
+    @return bytearray: bytes read, or None on error
+    """
+    def read_range(self, addr, mem_addr, length, addr_bytes=1):
+        rval = bytearray()
+        while len(rval) < length:
+            offset = mem_addr + len(rval)
+            if addr_bytes == 2:
+                write_bytes = [(offset >> 8) & 0xFF, offset & 0xFF]
+            else:
+                write_bytes = [offset & 0xFF]
+            chunk = self.write_then_read(addr, write_bytes, min(I2CCmd.MAX, length - len(rval)))
+            if chunk is None:
+                return None
+            rval.extend(chunk)
+        return rval
 
 
 """
@@ -0,0 +1,44 @@
+"""Worker for running CH341 operations outside the GUI thread"""
+
+from PyQt6.QtCore import QObject, pyqtSignal, pyqtSlot
+
+class HardwareWorker(QObject):
+    """Runs blocking CH341Manager operations in a worker thread
+
+    Move an instance to a QThread and trigger its slots through queued
+    signals; results and progress are reported back through signals.
+    """
+
+    progress_changed = pyqtSignal(int)
+    read_finished = pyqtSignal(object)
+    write_finished = pyqtSignal(bool)
+    erase_finished = pyqtSignal(bool)
+    verify_finished = pyqtSignal(bool, int)
+
+    def __init__(self, ch341):
+        super().__init__()
+        self.ch341 = ch341
+
+    @pyqtSlot()
+    def read(self):
+        """Read EEPROM contents"""
+        data = self.ch341.read_eeprom(self.progress_changed.emit)
+        self.read_finished.emit(data)
+
+    @pyqtSlot(object)
+    def write(self, data):
+        """Write data to EEPROM"""
+        success = self.ch341.write_eeprom(data, self.progress_changed.emit)
+        self.write_finished.emit(success)
+
+    @pyqtSlot()
+    def erase(self):
+        """Erase EEPROM contents"""
+        success = self.ch341.erase_eeprom(self.progress_changed.emit)
+        self.erase_finished.emit(success)
+        
+    @pyqtSlot(object)
+    def verify(self, expected_data):
+        """Verify EEPROM contents match expected data"""
+        success, mismatch = self.ch341.verify_eeprom(expected_data, self.progress_changed.emit)
+        self.verify_finished.emit(success, mismatch)
@@ -1,13 +1,24 @@
 #!/usr/bin/env python3
 # Main application entry point
 
+import os
 import sys
+from functools import lru_cache
 from PyQt6.QtWidgets import QApplication
 from PyQt6.QtCore import QSettings
 
 from ui.main_window import MainWindow
 from utils.logger import setup_logger
 
+STYLESHEET_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                               "ui", "styles", "dark_theme.qss")
+
+@lru_cache(maxsize=1)
+def load_stylesheet():
+    """Read the application stylesheet once"""
+    with open(STYLESHEET_PATH, "r") as f:
+        return f.read()
+
 def main():
     """Main application entry point"""
     # Setup logger
@@ -20,15 +31,15 @@ def main():
     app.setApplicationVersion("1.0.0")
     app.setOrganizationName("EEPROM Tools")
     
-    # Set application style
-    with open("ui/styles/dark_theme.qss", "r") as f:
-        app.setStyleSheet(f.read())
-    
     # Create settings
     settings = QSettings("EEPROM Tools", "EEPROM Programmer")
     
-    # Create and show main window
+    # Create main window
     window = MainWindow(settings, logger)
+    
+    # Set application style once the widget tree exists; widgets are
+    # polished against it when the window is first shown
+    app.setStyleSheet(load_stylesheet())
     window.show()
     
     # Run application
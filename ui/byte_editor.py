@@ -1,15 +1,30 @@
+import ctypes
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
                               QSpinBox, QLineEdit, QPushButton, QGroupBox)
-from PyQt6.QtCore import Qt, pyqtSlot, QRegularExpression
+from PyQt6.QtCore import Qt, pyqtSignal, pyqtSlot, QRegularExpression, QTimer, QSignalBlocker
 from PyQt6.QtGui import QIntValidator, QRegularExpressionValidator
 
+# Input patterns for address and byte value fields
+HEX_REGEX = QRegularExpression("[0-9A-Fa-f]+")
+BYTE_REGEX = QRegularExpression("[0-9A-Fa-f]{1,2}")  # Max 2 hex characters
+
+# Ranges at least this long are filled with memset in place
+LARGE_FILL_BYTES = 4096
+
+# Delay after the last address keystroke before the byte display updates
+ADDR_DEBOUNCE_MS = 40
+
 class ByteEditor(QWidget):
     """Byte editor widget for modifying individual bytes"""
     
+    # Emitted with the first and last address edited in the data buffer
+    data_modified = pyqtSignal(int, int)
+    
     def __init__(self, logger):
         super().__init__()
         self.logger = logger
         self.data = bytearray()
+        self._last_addr = None  # Address currently shown in the value fields
         self.init_ui()
         
     def init_ui(self):
@@ -25,17 +40,21 @@ class ByteEditor(QWidget):
         self.addr_edit = QLineEdit()
         self.addr_edit.setMaximumWidth(100)
         # Only allow hex characters
-        hex_regex = QRegularExpression("[0-9A-Fa-f]+")
-        self.addr_edit.setValidator(QRegularExpressionValidator(hex_regex))
+        self.addr_edit.setValidator(QRegularExpressionValidator(HEX_REGEX))
         self.addr_edit.textChanged.connect(self.update_current_byte)
         
+        # Coalesce fast typing and pastes into a single lookup
+        self._addr_debounce = QTimer(self)
+        self._addr_debounce.setSingleShot(True)
+        self._addr_debounce.setInterval(ADDR_DEBOUNCE_MS)
+        self._addr_debounce.timeout.connect(self._do_update_current_byte)
+        
         # Value input
         value_label = QLabel("Value (hex):")
         self.value_edit = QLineEdit()
         self.value_edit.setMaximumWidth(50)
         # Only allow hex characters, max 2
-        byte_regex = QRegularExpression("[0-9A-Fa-f]{1,2}")
-        self.value_edit.setValidator(QRegularExpressionValidator(byte_regex))
+        self.value_edit.setValidator(QRegularExpressionValidator(BYTE_REGEX))
         
         # ASCII representation
         ascii_label = QLabel("ASCII:")
@@ -67,19 +86,19 @@ class ByteEditor(QWidget):
         start_label = QLabel("Start:")
         self.start_edit = QLineEdit()
         self.start_edit.setMaximumWidth(100)
-        self.start_edit.setValidator(QRegularExpressionValidator(hex_regex))
+        self.start_edit.setValidator(QRegularExpressionValidator(HEX_REGEX))
         
         # End address
         end_label = QLabel("End:")
         self.end_edit = QLineEdit()
         self.end_edit.setMaximumWidth(100)
-        self.end_edit.setValidator(QRegularExpressionValidator(hex_regex))
+        self.end_edit.setValidator(QRegularExpressionValidator(HEX_REGEX))
         
         # Fill value
         fill_label = QLabel("Fill Value:")
         self.fill_edit = QLineEdit()
         self.fill_edit.setMaximumWidth(50)
-        self.fill_edit.setValidator(QRegularExpressionValidator(byte_regex))
+        self.fill_edit.setValidator(QRegularExpressionValidator(BYTE_REGEX))
         self.fill_edit.setText("FF")
         
         # Fill button
@@ -103,6 +122,7 @@ class ByteEditor(QWidget):
     def set_data(self, data):
         """Set data for the editor"""
         self.data = data
+        self._last_addr = None
         
     def get_data(self):
         """Get current data"""
@@ -110,23 +130,35 @@ class ByteEditor(QWidget):
         
     @pyqtSlot()
     def update_current_byte(self):
+        """Schedule a value and ASCII display update for the current address"""
+        self._addr_debounce.start()
+        
+    @pyqtSlot()
+    def _do_update_current_byte(self):
         """Update value and ASCII displays for current address"""
         try:
             addr_text = self.addr_edit.text()
             if not addr_text:
+                self._last_addr = None
                 return
                 
             addr = int(addr_text, 16)
+            if addr == self._last_addr:
+                return
+                
             if addr < len(self.data):
+                self._last_addr = addr
                 # Update value
                 value = self.data[addr]
-                self.value_edit.setText(f"{value:02X}")
+                with QSignalBlocker(self.value_edit):
+                    self.value_edit.setText(f"{value:02X}")
                 
-                # Update ASCII
-                if 32 <= value <= 126:  # Printable ASCII
-                    self.ascii_edit.setText(chr(value))
-                else:
-                    self.ascii_edit.setText("")
+                # Update ASCII without re-entering ascii_changed
+                with QSignalBlocker(self.ascii_edit):
+                    if 32 <= value <= 126:  # Printable ASCII
+                        self.ascii_edit.setText(chr(value))
+                    else:
+                        self.ascii_edit.setText("")
         except ValueError:
             pass
             
@@ -137,7 +169,8 @@ class ByteEditor(QWidget):
             # Get ASCII value
             value = ord(text[0])
             # Update hex value
-            self.value_edit.setText(f"{value:02X}")
+            with QSignalBlocker(self.value_edit):
+                self.value_edit.setText(f"{value:02X}")
             
     @pyqtSlot()
     def write_byte(self):
@@ -154,6 +187,8 @@ class ByteEditor(QWidget):
             
             if addr < len(self.data):
                 self.data[addr] = value
+                self._last_addr = None  # Shown value is stale now
+                self.data_modified.emit(addr, addr)
                 self.logger.info(f"Wrote byte at address 0x{addr:04X}: 0x{value:02X}")
                 
                 # Move to next address
@@ -181,10 +216,18 @@ class ByteEditor(QWidget):
                 self.logger.error("Invalid address range")
                 return
                 
-            # Fill range
-            for addr in range(start, end + 1):
-                self.data[addr] = fill
+            count = end - start + 1
+            if count >= LARGE_FILL_BYTES and isinstance(self.data, bytearray):
+                # memset directly into the buffer, without a temporary fill block
+                view = (ctypes.c_char * count).from_buffer(self.data, start)
+                ctypes.memset(view, fill, count)
+                del view  # Release the buffer export so data can be resized again
+            else:
+                # Fill range in one slice assignment
+                self.data[start:start + count] = bytes((fill,)) * count
                 
+            self._last_addr = None  # Shown value may be stale now
+            self.data_modified.emit(start, end)
             self.logger.info(f"Filled range 0x{start:04X}-0x{end:04X} with 0x{fill:02X}")
         except ValueError:
             self.logger.error("Invalid address or value")
\ No newline at end of file
@@ -0,0 +1,39 @@
+"""Background jobs for Intel HEX file import and export"""
+
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
+
+from utils.hex_format import iter_intel_hex_lines, intel_hex_to_data
+
+class HexJobSignals(QObject):
+    """Signals reported by a HexJob"""
+
+    done = pyqtSignal(str, object)  # File name, loaded data (None after a save)
+    error = pyqtSignal(str, str)    # File name, error message
+
+class HexJob(QRunnable):
+    """Load or save an Intel HEX file on a QThreadPool thread
+
+    Pass data to save it to file_name; leave it as None to load file_name
+    instead. Results are reported through the signals attribute.
+    """
+
+    def __init__(self, file_name, data=None):
+        super().__init__()
+        self.file_name = file_name
+        # Snapshot the data so later edits in the GUI can't race the save
+        self.data = None if data is None else bytes(data)
+        self.signals = HexJobSignals()
+
+    def run(self):
+        try:
+            if self.data is None:
+                with open(self.file_name, 'r') as f:
+                    hex_data = f.read()
+                self.signals.done.emit(self.file_name, intel_hex_to_data(hex_data))
+            else:
+                with open(self.file_name, 'w') as f:
+                    # Stream records to the file instead of building the whole text
+                    f.writelines(line + "\n" for line in iter_intel_hex_lines(self.data))
+                self.signals.done.emit(self.file_name, None)
+        except Exception as e:
+            self.signals.error.emit(self.file_name, str(e))
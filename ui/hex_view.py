@@ -1,6 +1,153 @@
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QTableWidget, QTableWidgetItem, QHeaderView, QFrame
-from PyQt6.QtCore import Qt, pyqtSlot
-from PyQt6.QtGui import QFont, QColor
+import zlib
+from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QTableView, QHeaderView, QFrame,
+                             QAbstractItemView, QStyledItemDelegate, QApplication)
+from PyQt6.QtCore import Qt, pyqtSlot, QAbstractTableModel, QModelIndex
+from PyQt6.QtGui import QFont, QColor, QKeySequence, QShortcut
+
+# Cell text for every byte value, indexed by the byte
+HEX_LUT = [f"{b:02X}" for b in range(256)]
+ASCII_LUT = [chr(b) if 32 <= b <= 126 else '.' for b in range(256)]
+
+class HexTableModel(QAbstractTableModel):
+    """Table model exposing a byte buffer as hex and ASCII columns
+    
+    Cell text is generated on demand in data(), so only the rows the view
+    actually paints are ever formatted. Rows are exposed to the view in
+    batches through fetchMore() as it scrolls towards the end.
+    """
+    
+    BYTES_PER_ROW = 16
+    SEPARATOR_COLUMN = BYTES_PER_ROW  # Blank column between hex and ASCII
+    FETCH_ROWS = 256  # Rows exposed per fetchMore() batch
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._data = bytearray()
+        self._loaded_rows = 0  # Rows currently exposed to the view
+        self._row_header_cache = []  # Address labels, grown as rows appear
+        
+    def _total_rows(self, data):
+        """Number of rows needed to show all of data"""
+        return (len(data) + self.BYTES_PER_ROW - 1) // self.BYTES_PER_ROW
+        
+    def set_data(self, data):
+        """Replace the displayed buffer"""
+        if self._total_rows(data) == self._total_rows(self._data):
+            # Same shape: keep the layout and just repaint the loaded cells
+            self._data = data
+            if self._loaded_rows:
+                self.dataChanged.emit(self.index(0, 0),
+                                      self.index(self._loaded_rows - 1, self.columnCount() - 1))
+            return
+            
+        self.beginResetModel()
+        self._data = data
+        self._loaded_rows = min(self._total_rows(data), self.FETCH_ROWS)
+        self.endResetModel()
+        
+    def swap_buffer(self, data):
+        """Point at a buffer with the same contents without repainting"""
+        self._data = data
+        
+    def byte_changed(self, address):
+        """Repaint only the hex and ASCII cells of the byte at address"""
+        row, col = divmod(address, self.BYTES_PER_ROW)
+        if row >= self._loaded_rows:
+            return  # Not shown yet; it is read when the row gets fetched
+        hex_index = self.index(row, col)
+        ascii_index = self.index(row, col + self.SEPARATOR_COLUMN + 1)
+        self.dataChanged.emit(hex_index, hex_index)
+        self.dataChanged.emit(ascii_index, ascii_index)
+        
+    def range_changed(self, first, last):
+        """Repaint the loaded rows holding bytes first to last"""
+        first_row = first // self.BYTES_PER_ROW
+        last_row = min(last // self.BYTES_PER_ROW, self._loaded_rows - 1)
+        if first_row > last_row:
+            return  # Not shown yet; read when the rows get fetched
+        self.dataChanged.emit(self.index(first_row, 0),
+                              self.index(last_row, self.columnCount() - 1))
+        
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return self._loaded_rows
+        
+    def canFetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return False
+        return self._loaded_rows < self._total_rows(self._data)
+        
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        count = min(self.FETCH_ROWS, self._total_rows(self._data) - self._loaded_rows)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded_rows, self._loaded_rows + count - 1)
+        self._loaded_rows += count
+        self.endInsertRows()
+        
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid() or not self._data:
+            return 0
+        # 16 columns for hex + separator + 16 for ASCII
+        return self.BYTES_PER_ROW * 2 + 1
+        
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole or not index.isValid():
+            return None
+            
+        idx = self.address(index)
+        if idx is None:
+            return None  # Separator and padding past the end of the data stay empty
+            
+        if index.column() < self.SEPARATOR_COLUMN:
+            return HEX_LUT[self._data[idx]]
+        return ASCII_LUT[self._data[idx]]
+        
+    def address(self, index):
+        """Return the data offset shown by a cell, or None for separator/padding"""
+        col = index.column()
+        if col == self.SEPARATOR_COLUMN:
+            return None
+        if col > self.SEPARATOR_COLUMN:
+            col -= self.SEPARATOR_COLUMN + 1
+        idx = index.row() * self.BYTES_PER_ROW + col
+        return idx if idx < len(self._data) else None
+        
+    def flags(self, index):
+        if index.column() == self.SEPARATOR_COLUMN:
+            return Qt.ItemFlag.ItemIsEnabled
+        if self.address(index) is None:
+            return Qt.ItemFlag.NoItemFlags  # Padding past the end of the data
+        return Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled
+        
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+            
+        if orientation == Qt.Orientation.Vertical:
+            # Row headers are addresses
+            cache = self._row_header_cache
+            if section >= len(cache):
+                end = max(section + 1, self.rowCount())
+                cache.extend(map('{:08X}'.format,
+                                 range(len(cache) * self.BYTES_PER_ROW, end * self.BYTES_PER_ROW, self.BYTES_PER_ROW)))
+            return cache[section]
+            
+        if section < self.SEPARATOR_COLUMN:
+            return f"{section:02X}"
+        if section == self.SEPARATOR_COLUMN:
+            return ""
+        return f"A{section - self.SEPARATOR_COLUMN - 1:X}"
+
+class HexDelegate(QStyledItemDelegate):
+    """Item delegate that centers the text of every cell"""
+    
+    def initStyleOption(self, option, index):
+        super().initStyleOption(option, index)
+        option.displayAlignment = Qt.AlignmentFlag.AlignCenter
 
 class HexView(QWidget):
     """Hex view widget for displaying EEPROM data in table format"""
@@ -9,6 +156,7 @@ class HexView(QWidget):
         super().__init__()
         self.logger = logger
         self.data = bytearray()
+        self._last_fingerprint = (0, 0)  # (length, CRC-32) of the displayed data
         self.init_ui()
         
     def init_ui(self):
@@ -22,7 +170,11 @@ class HexView(QWidget):
         font.setPointSize(10)
         
         # Create table for hex view
-        self.table = QTableWidget()
+        self.model = HexTableModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.setItemDelegate(HexDelegate(self.table))
+        self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         self.table.setFont(font)
         self.table.setShowGrid(True)
         self.table.setGridStyle(Qt.PenStyle.SolidLine)
@@ -30,20 +182,20 @@ class HexView(QWidget):
         self.table.horizontalHeader().setVisible(True)
         self.table.setAlternatingRowColors(True)
         
+        # Uniform cell sizes come from the header defaults
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.table.horizontalHeader().setDefaultSectionSize(35)
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.table.verticalHeader().setDefaultSectionSize(30)
+        
         # Set dark theme colors
         self.table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 background-color: #1E1E1E;
                 color: #D4D4D4;
                 border: 1px solid #333333;
                 gridline-color: #333333;
-            }
-            QTableWidget::item {
-                padding: 5px;
-                font-family: "Monospace";
-            }
-            QTableWidget::item:selected {
-                background-color: #264F78;
+                selection-background-color: #264F78;
             }
             QHeaderView::section {
                 background-color: #252526;
@@ -52,16 +204,29 @@ class HexView(QWidget):
                 border: 1px solid #333333;
                 font-family: "Monospace";
             }
-            QTableWidget:alternate-background-color {
+            QTableView:alternate-background-color {
                 background-color: #252526;
             }
         """)
         
+        # Copy selected bytes to the clipboard as hex
+        copy_shortcut = QShortcut(QKeySequence.StandardKey.Copy, self.table)
+        copy_shortcut.activated.connect(self.copy_selection)
+        
         layout.addWidget(self.table)
         
     def set_data(self, data):
         """Set data and update the hex view"""
+        fingerprint = (len(data), zlib.crc32(data))
         self.data = data
+        if fingerprint == self._last_fingerprint:
+            # Same contents as last set; the old buffer may have been edited
+            # in place since, so repaint without resetting the model
+            self.model.swap_buffer(data)
+            self.table.viewport().update()
+            return
+            
+        self._last_fingerprint = fingerprint
         self.update_hex_view()
         
     def get_data(self):
@@ -70,87 +235,51 @@ class HexView(QWidget):
         
     def update_hex_view(self):
         """Update the hex view with current data"""
-        if not self.data:
-            self.table.setRowCount(0)
-            self.table.setColumnCount(0)
-            return
+        # Suspend painting while the model resets
+        self.table.setUpdatesEnabled(False)
+        self.table.blockSignals(True)
+        try:
+            self.model.set_data(self.data)
             
-        bytes_per_row = 16
-        num_rows = (len(self.data) + bytes_per_row - 1) // bytes_per_row
-        
-        # Set up table structure - 16 columns for hex + separator + 16 for ASCII
-        total_columns = bytes_per_row * 2 + 1  # Added separator column
-        self.table.setRowCount(num_rows)
-        self.table.setColumnCount(total_columns)
-        
-        # Set up headers
-        headers = []
-        # Hex headers
-        for i in range(bytes_per_row):
-            headers.append(f"{i:02X}")
-        # Separator header
-        headers.append("")
-        # ASCII headers
-        for i in range(bytes_per_row):
-            headers.append(f"A{i:X}")
-        self.table.setHorizontalHeaderLabels(headers)
-        
-        # Set row headers (addresses)
-        row_headers = [f"{i * bytes_per_row:08X}" for i in range(num_rows)]
-        self.table.setVerticalHeaderLabels(row_headers)
-        
-        # Fill table with data
-        for row in range(num_rows):
-            # Add separator column
-            separator_item = QTableWidgetItem("")
-            separator_item.setFlags(Qt.ItemFlag.ItemIsEnabled)
-            # separator_item.setBackground(QColor("#333333"))
-            self.table.setItem(row, bytes_per_row, separator_item)
+            # Only the separator column differs from the default width
+            if self.model.columnCount():
+                self.table.setColumnWidth(HexTableModel.SEPARATOR_COLUMN, 20)
+        finally:
+            self.table.blockSignals(False)
+            self.table.setUpdatesEnabled(True)
+        self.table.viewport().update()
             
-            for col in range(bytes_per_row):
-                idx = row * bytes_per_row + col
-                if idx < len(self.data):
-                    byte = self.data[idx]
-                    
-                    # Hex value
-                    hex_item = QTableWidgetItem(f"{byte:02X}")
-                    hex_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                    hex_item.setFlags(Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled)
-                    self.table.setItem(row, col, hex_item)
-                    
-                    # ASCII value (in separate column after separator)
-                    ascii_char = chr(byte) if 32 <= byte <= 126 else '.'
-                    ascii_item = QTableWidgetItem(ascii_char)
-                    ascii_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                    ascii_item.setFlags(Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled)
-                    self.table.setItem(row, col + bytes_per_row + 1, ascii_item)
-                else:
-                    # Empty cells for padding
-                    empty_hex = QTableWidgetItem("")
-                    empty_hex.setFlags(Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled)
-                    self.table.setItem(row, col, empty_hex)
-                    
-                    empty_ascii = QTableWidgetItem("")
-                    empty_ascii.setFlags(Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled)
-                    self.table.setItem(row, col + bytes_per_row + 1, empty_ascii)
-        
-        # Adjust column widths
-        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
-        for col in range(total_columns):
-            if col == bytes_per_row:  # Separator column
-                self.table.setColumnWidth(col, 20)
-            else:
-                self.table.setColumnWidth(col, 35)
-        
-        # Adjust row heights
-        self.table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
-        for row in range(num_rows):
-            self.table.setRowHeight(row, 30)
+    @pyqtSlot(int, int)
+    def data_modified(self, first, last):
+        """Repaint bytes first to last after the shared buffer was edited in place"""
+        self._last_fingerprint = None
+        if first == last:
+            self.model.byte_changed(first)
+        else:
+            self.model.range_changed(first, last)
             
     def modify_byte(self, address, value):
         """Modify a byte at the specified address"""
         if 0 <= address < len(self.data):
             self.data[address] = value
-            self.update_hex_view()
+            self._last_fingerprint = None
+            self.model.byte_changed(address)
             return True
-        return False
\ No newline at end of file
+        return False
+        
+    @pyqtSlot()
+    def copy_selection(self):
+        """Copy the selected bytes to the clipboard as space-separated hex"""
+        addresses = sorted({addr for addr in map(self.model.address, self.table.selectedIndexes())
+                            if addr is not None})
+        if not addresses:
+            return
+            
+        first, last = addresses[0], addresses[-1]
+        if last - first + 1 == len(addresses):
+            # Contiguous selection: convert the slice in one go
+            selected = memoryview(self.data)[first:last + 1]
+        else:
+            selected = bytes(self.data[addr] for addr in addresses)
+            
+        QApplication.clipboard().setText(selected.hex(' ').upper())
@@ -1,7 +1,14 @@
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QTextEdit, QPushButton, QHBoxLayout
-from PyQt6.QtCore import Qt, pyqtSlot, QObject, pyqtSignal
+from PyQt6.QtCore import Qt, pyqtSlot, QObject, pyqtSignal, QTimer
 from PyQt6.QtGui import QFont, QTextCursor, QColor, QTextCharFormat, QBrush
 import logging
+from collections import deque
+
+# Delay before pending log messages are written to the console
+FLUSH_INTERVAL_MS = 50
+
+# Oldest lines are dropped once the console holds this many
+MAX_LOG_LINES = 5000
 
 class QTextEditLogger(QObject, logging.Handler):
     """Logger handler that emits logs to a QTextEdit"""
@@ -22,6 +29,13 @@ class LogConsole(QWidget):
     def __init__(self, logger):
         super().__init__()
         self.logger = logger
+        self._pending = deque()  # (message, level) waiting for the next flush
+        
+        # Text formats per log level, built once
+        self._fmt_error = self._make_format("#FF5252")  # Red
+        self._fmt_warn = self._make_format("#FFD740")   # Amber
+        self._fmt_info = self._make_format("#FFFFFF")   # White
+        self._fmt_debug = self._make_format("#B0BEC5")  # Blue Grey
         self.init_ui()
         self.setup_logger()
         
@@ -33,6 +47,13 @@ class LogConsole(QWidget):
         # Create log text edit
         self.log_edit = QTextEdit()
         self.log_edit.setReadOnly(True)
+        self.log_edit.document().setMaximumBlockCount(MAX_LOG_LINES)
+        
+        # Coalesce bursts of messages into one document update
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(FLUSH_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self._flush)
         
         # Set monospaced font
         font = QFont("Monospace")
@@ -81,23 +102,47 @@ class LogConsole(QWidget):
         
     @pyqtSlot(str, int)
     def append_log(self, message, level):
-        """Append log message with appropriate formatting"""
-        # Create text format based on log level
+        """Queue log message for the next flush"""
+        self._pending.append((message, level))
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+            
+    @staticmethod
+    def _make_format(color):
+        """Create a text format with the given foreground color"""
         text_format = QTextCharFormat()
+        text_format.setForeground(QBrush(QColor(color)))
+        return text_format
         
+    def _text_format(self, level):
+        """Return the cached text format for a log level"""
         if level >= logging.ERROR:
-            text_format.setForeground(QBrush(QColor("#FF5252")))  # Red
+            return self._fmt_error
         elif level >= logging.WARNING:
-            text_format.setForeground(QBrush(QColor("#FFD740")))  # Amber
+            return self._fmt_warn
         elif level >= logging.INFO:
-            text_format.setForeground(QBrush(QColor("#FFFFFF")))  # White
-        else:  # DEBUG
-            text_format.setForeground(QBrush(QColor("#B0BEC5")))  # Blue Grey
+            return self._fmt_info
+        return self._fmt_debug  # DEBUG
+        
+    @pyqtSlot()
+    def _flush(self):
+        """Append queued messages, one insert per run of equal level"""
+        if not self._pending:
+            return
             
-        # Append text with format
         cursor = self.log_edit.textCursor()
         cursor.movePosition(QTextCursor.MoveOperation.End)
-        cursor.insertText(message + "\n", text_format)
+        
+        group_level = None
+        group = []
+        while self._pending:
+            message, level = self._pending.popleft()
+            if level != group_level and group:
+                cursor.insertText("\n".join(group) + "\n", self._text_format(group_level))
+                group = []
+            group_level = level
+            group.append(message)
+        cursor.insertText("\n".join(group) + "\n", self._text_format(group_level))
         
         # Auto-scroll to bottom
         cursor.movePosition(QTextCursor.MoveOperation.End)
@@ -106,4 +151,5 @@ class LogConsole(QWidget):
     @pyqtSlot()
     def clear_log(self):
         """Clear log text"""
+        self._pending.clear()
         self.log_edit.clear()
\ No newline at end of file
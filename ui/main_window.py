@@ -2,34 +2,51 @@ import os
 from PyQt6.QtWidgets import (QMainWindow, QVBoxLayout, QHBoxLayout, 
                               QWidget, QPushButton, QComboBox, QLabel, 
                               QTabWidget, QSplitter, QFileDialog, 
-                              QMessageBox, QStatusBar, QGroupBox)
-from PyQt6.QtCore import Qt, QTimer, pyqtSlot, pyqtSignal
+                              QMessageBox, QStatusBar, QGroupBox, QProgressBar)
+from PyQt6.QtCore import Qt, QTimer, QThread, QThreadPool, pyqtSlot, pyqtSignal
 from PyQt6.QtGui import QIcon, QFont
 
 from ui.hex_view import HexView
 from ui.byte_editor import ByteEditor
 from ui.log_console import LogConsole
+from ui.hex_job import HexJob
 from hardware.ch341_manager import CH341Manager
-from utils.eeprom_types import EEPROM_SIZES, I2C_SPEEDS, MANUFACTURERS
+from hardware.hardware_worker import HardwareWorker
+from utils.eeprom_types import (EEPROM_SIZES, EEPROM_BY_BASE, I2C_SPEEDS, MANUFACTURERS,
+                                MANUFACTURER_DISPLAY_NAMES)
 
 class MainWindow(QMainWindow):
     """Main application window"""
     
+    # Requests for the hardware worker thread
+    read_requested = pyqtSignal()
+    write_requested = pyqtSignal(object)
+    erase_requested = pyqtSignal()
+    verify_requested = pyqtSignal(object)
+    
     def __init__(self, settings, logger):
         super().__init__()
         self.settings = settings
         self.logger = logger
         self.ch341 = CH341Manager(logger)
+        self.current_eeprom = None  # EEPROM_SIZES entry used for the current connection
+        
+        # Run blocking EEPROM operations in a worker thread
+        self.worker_thread = QThread(self)
+        self.worker = HardwareWorker(self.ch341)
+        self.worker.moveToThread(self.worker_thread)
+        self.worker_thread.start()
+        
+        # Slow check for an unplugged adapter, only run while connected
+        self.busy = False
+        self.status_timer = QTimer(self)
+        self.status_timer.setInterval(5000)
+        self.status_timer.timeout.connect(self.check_connection)
         
         self.init_ui()
         self.setup_connections()
         self.load_settings()
         
-        # Status update timer
-        self.status_timer = QTimer(self)
-        self.status_timer.timeout.connect(self.update_status)
-        self.status_timer.start(1000)  # Update every second
-        
     def init_ui(self):
         """Initialize the user interface"""
         self.setWindowTitle("EEPROM Programmer")
@@ -75,6 +92,12 @@ class MainWindow(QMainWindow):
         self.status_bar = QStatusBar()
         self.setStatusBar(self.status_bar)
         
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setRange(0, 100)
+        self.progress_bar.setMaximumWidth(200)
+        self.progress_bar.hide()
+        self.status_bar.addPermanentWidget(self.progress_bar)
+        
         self.connection_status = QLabel("Status: Disconnected")
         self.status_bar.addPermanentWidget(self.connection_status)
         
@@ -106,6 +129,7 @@ class MainWindow(QMainWindow):
         # Connect button
         self.connect_button = QPushButton("Connect")
         self.connect_button.setProperty("type", "connect")
+        self.connect_button_connected = False
         
         # Detect button
         self.detect_button = QPushButton("Detect EEPROM")
@@ -168,28 +192,20 @@ class MainWindow(QMainWindow):
         
     def update_eeprom_sizes(self, manufacturer):
         """Update EEPROM size dropdown based on selected manufacturer"""
+        names = MANUFACTURER_DISPLAY_NAMES.get(manufacturer, [])
         self.eeprom_size_combo.clear()
-        if manufacturer in MANUFACTURERS:
-            devices = MANUFACTURERS[manufacturer]["devices"]
-            prefix = MANUFACTURERS[manufacturer]["prefix"]
-            
-            for size in EEPROM_SIZES:
-                # Extract base model (e.g., "24C32" from "24C32 (32Kbit / 4K bytes)")
-                base_model = size["name"].split()[0]
-                # Check if this size matches any of the manufacturer's devices
-                if any(device in base_model for device in devices):
-                    # Add manufacturer prefix if needed
-                    if not base_model.startswith(prefix):
-                        display_name = f"{prefix}{base_model[4:]} {size['name'][6:]}"
-                    else:
-                        display_name = size["name"]
-                    self.eeprom_size_combo.addItem(display_name)
+        self.eeprom_size_combo.addItems(names)
+        self.eeprom_combo_index = {name: i for i, name in enumerate(names)}
         
     def setup_connections(self):
         """Connect UI signals to slots"""
         # Connection buttons
         self.connect_button.clicked.connect(self.toggle_connection)
         self.detect_button.clicked.connect(self.detect_eeprom)
+        self.ch341.connection_changed.connect(self.connection_changed)
+        
+        # Keep the hex view in step with edits made in the byte editor
+        self.byte_editor.data_modified.connect(self.hex_view.data_modified)
         
         # Operation buttons
         self.read_button.clicked.connect(self.read_eeprom)
@@ -199,6 +215,17 @@ class MainWindow(QMainWindow):
         self.dump_button.clicked.connect(self.save_hex_file)
         self.load_button.clicked.connect(self.load_hex_file)
         
+        # Hardware worker
+        self.read_requested.connect(self.worker.read)
+        self.write_requested.connect(self.worker.write)
+        self.erase_requested.connect(self.worker.erase)
+        self.verify_requested.connect(self.worker.verify)
+        self.worker.progress_changed.connect(self.progress_bar.setValue)
+        self.worker.read_finished.connect(self.read_finished)
+        self.worker.write_finished.connect(self.write_finished)
+        self.worker.erase_finished.connect(self.erase_finished)
+        self.worker.verify_finished.connect(self.verify_finished)
+        
     def load_settings(self):
         """Load settings from QSettings"""
         # Restore window geometry
@@ -227,6 +254,9 @@ class MainWindow(QMainWindow):
     def closeEvent(self, event):
         """Handle window close event"""
         self.save_settings()
+        # Stop the hardware worker before releasing the device
+        self.worker_thread.quit()
+        self.worker_thread.wait()
         # Disconnect from CH341 if connected
         if self.ch341.is_connected():
             self.ch341.disconnect()
@@ -234,10 +264,9 @@ class MainWindow(QMainWindow):
         
     def get_eeprom_size_by_name(self, name):
         """Get EEPROM size configuration by name"""
-        for size in EEPROM_SIZES:
-            if name in size["name"]:
-                return size
-        return None
+        if not name:
+            return None
+        return EEPROM_BY_BASE.get(name.split()[0])
         
     @pyqtSlot()
     def toggle_connection(self):
@@ -255,24 +284,32 @@ class MainWindow(QMainWindow):
             
             if success:
                 self.logger.info(f"Connected to CH341 with {i2c_speed['name']}")
-                self.connect_button.setText("Disconnect")
-                self.connect_button.setProperty("type", "disconnect")
-                self.connect_button.style().unpolish(self.connect_button)
-                self.connect_button.style().polish(self.connect_button)
+                self.current_eeprom = eeprom_size
+                self.set_connect_state(True)
                 self.update_ui_connected()
             else:
                 QMessageBox.critical(self, "Connection Error", 
                                    "Failed to connect to CH341 device.")
         else:
-            # Disconnect from CH341
+            # Disconnect from CH341; connection_changed resets the UI
             self.ch341.disconnect()
             self.logger.info("Disconnected from CH341")
+    
+    def set_connect_state(self, connected):
+        """Switch the connect button between Connect and Disconnect"""
+        if connected == self.connect_button_connected:
+            return  # Already styled for this state; skip the repolish
+            
+        self.connect_button_connected = connected
+        if connected:
+            self.connect_button.setText("Disconnect")
+            self.connect_button.setProperty("type", "disconnect")
+        else:
             self.connect_button.setText("Connect")
             self.connect_button.setProperty("type", "connect")
-            self.connect_button.style().unpolish(self.connect_button)
-            self.connect_button.style().polish(self.connect_button)
-            self.update_ui_disconnected()
-    
+        self.connect_button.style().unpolish(self.connect_button)
+        self.connect_button.style().polish(self.connect_button)
+        
     def update_ui_connected(self):
         """Update UI elements for connected state"""
         self.detect_button.setEnabled(True)
@@ -291,13 +328,54 @@ class MainWindow(QMainWindow):
         self.verify_button.setEnabled(False)
         self.dump_button.setEnabled(False)
         
+    def set_busy(self, busy):
+        """Lock the controls while a hardware operation runs in the worker"""
+        self.busy = busy
+        if busy:
+            self.progress_bar.setValue(0)
+            self.progress_bar.show()
+            self.update_ui_disconnected()
+        else:
+            self.progress_bar.hide()
+            if self.ch341.is_connected():
+                self.update_ui_connected()
+        self.connect_button.setEnabled(not busy)
+        self.load_button.setEnabled(not busy)
+        
+    @pyqtSlot(bool)
+    def connection_changed(self, connected):
+        """Refresh the status bar when the adapter connects or disconnects
+        
+        Also resets the controls on a disconnect, whether requested by the
+        user or detected by check_connection.
+        """
+        self.update_status()
+        if connected:
+            self.status_timer.start()
+        else:
+            self.status_timer.stop()
+            self.current_eeprom = None
+            self.set_connect_state(False)
+            self.update_ui_disconnected()
+            
+    @pyqtSlot()
+    def check_connection(self):
+        """Disconnect if the adapter has been unplugged"""
+        # Operations in the worker report their own failures
+        if not self.busy:
+            self.ch341.check_adapter()  # Emits connection_changed on failure
+            
     @pyqtSlot()
     def update_status(self):
         """Update status bar with current connection state"""
         if self.ch341.is_connected():
-            self.connection_status.setText("Status: Connected")
+            status = "Status: Connected"
         else:
-            self.connection_status.setText("Status: Disconnected")
+            status = "Status: Disconnected"
+            
+        # Only touch the label when the text actually changes
+        if status != self.connection_status.text():
+            self.connection_status.setText(status)
             
     @pyqtSlot()
     def detect_eeprom(self):
@@ -310,10 +388,9 @@ class MainWindow(QMainWindow):
             detected_size = self.get_eeprom_size_by_name(eeprom_info["type"])
             if detected_size:
                 # Update UI with detected type
-                for i in range(self.eeprom_size_combo.count()):
-                    if detected_size["name"] in self.eeprom_size_combo.itemText(i):
-                        self.eeprom_size_combo.setCurrentIndex(i)
-                        break
+                index = self.eeprom_combo_index.get(detected_size["name"])
+                if index is not None:
+                    self.eeprom_size_combo.setCurrentIndex(index)
             
             msg = (f"Detected EEPROM:\n"
                   f"Type: {eeprom_info['type']}\n"
@@ -328,17 +405,22 @@ class MainWindow(QMainWindow):
     def read_eeprom(self):
         """Read EEPROM contents"""
         self.logger.info("Reading EEPROM...")
-        self.statusBar().showMessage("Reading EEPROM...")
-        
-        data = self.ch341.read_eeprom()
+        self.status_bar.showMessage("Reading EEPROM...")
+        self.set_busy(True)
+        self.read_requested.emit()
+        
+    @pyqtSlot(object)
+    def read_finished(self, data):
+        """Handle completion of an EEPROM read"""
+        self.set_busy(False)
         if data:
             self.hex_view.set_data(data)
             self.byte_editor.set_data(data)
-            self.statusBar().showMessage("EEPROM read successfully", 3000)
+            self.status_bar.showMessage("EEPROM read successfully", 3000)
         else:
             QMessageBox.warning(self, "Read Failed", 
                               "Failed to read EEPROM contents.")
-            self.statusBar().showMessage("EEPROM read failed", 3000)
+            self.status_bar.showMessage("EEPROM read failed", 3000)
             
     @pyqtSlot()
     def write_eeprom(self):
@@ -356,15 +438,22 @@ class MainWindow(QMainWindow):
         
         if reply == QMessageBox.StandardButton.Yes:
             self.logger.info("Writing EEPROM...")
-            self.statusBar().showMessage("Writing EEPROM...")
+            self.status_bar.showMessage("Writing EEPROM...")
+            self.set_busy(True)
+            # Hand the worker a snapshot so edits made during the write
+            # don't change the pages being written or verified
+            self.write_requested.emit(bytes(data))
             
-            success = self.ch341.write_eeprom(data)
-            if success:
-                self.statusBar().showMessage("EEPROM written successfully", 3000)
-            else:
-                QMessageBox.warning(self, "Write Failed", 
-                                  "Failed to write EEP ROM.")
-                self.statusBar().showMessage("EEPROM write failed", 3000)
+    @pyqtSlot(bool)
+    def write_finished(self, success):
+        """Handle completion of an EEPROM write"""
+        self.set_busy(False)
+        if success:
+            self.status_bar.showMessage("EEPROM written successfully", 3000)
+        else:
+            QMessageBox.warning(self, "Write Failed", 
+                              "Failed to write EEP ROM.")
+            self.status_bar.showMessage("EEPROM write failed", 3000)
                 
     @pyqtSlot()
     def erase_eeprom(self):
@@ -376,24 +465,27 @@ class MainWindow(QMainWindow):
         
         if reply == QMessageBox.StandardButton.Yes:
             self.logger.info("Erasing EEPROM...")
-            self.statusBar().showMessage("Erasing EEPROM...")
+            self.status_bar.showMessage("Erasing EEPROM...")
+            self.set_busy(True)
+            self.erase_requested.emit()
+            
+    @pyqtSlot(bool)
+    def erase_finished(self, success):
+        """Handle completion of an EEPROM erase"""
+        self.set_busy(False)
+        if success:
+            # Update views with empty data for the connected EEPROM
+            empty_data = bytearray(b'\xff') * self.current_eeprom["bytes"]
+            
+            self.hex_view.set_data(empty_data)
+            self.byte_editor.set_data(empty_data)
+            
+            self.status_bar.showMessage("EEPROM erased successfully", 3000)
+        else:
+            QMessageBox.warning(self, "Erase Failed", 
+                              "Failed to erase EEPROM.")
+            self.status_bar.showMessage("EEPROM erase failed", 3000)
             
-            success = self.ch341.erase_eeprom()
-            if success:
-                # Update views with empty data
-                eeprom_idx = self.eeprom_size_combo.currentIndex()
-                eeprom_size = EEPROM_SIZES[eeprom_idx]
-                empty_data = bytearray([0xFF] * eeprom_size["bytes"])
-                
-                self.hex_view.set_data(empty_data)
-                self.byte_editor.set_data(empty_data)
-                
-                self.statusBar().showMessage("EEPROM erased successfully", 3000)
-            else:
-                QMessageBox.warning(self, "Erase Failed", 
-                                  "Failed to erase EEPROM.")
-                self.statusBar().showMessage("EEPROM erase failed", 3000)
-                
     @pyqtSlot()
     def verify_eeprom(self):
         """Verify EEPROM contents match current data"""
@@ -404,17 +496,22 @@ class MainWindow(QMainWindow):
             return
             
         self.logger.info("Verifying EEPROM...")
-        self.statusBar().showMessage("Verifying EEPROM...")
-        
-        success, mismatch = self.ch341.verify_eeprom(expected_data)
+        self.status_bar.showMessage("Verifying EEPROM...")
+        self.set_busy(True)
+        self.verify_requested.emit(bytes(expected_data))  # Snapshot, as for writes
+        
+    @pyqtSlot(bool, int)
+    def verify_finished(self, success, mismatch):
+        """Handle completion of an EEPROM verify"""
+        self.set_busy(False)
         if success:
             QMessageBox.information(self, "Verify Successful", 
                                  "EEPROM contents match expected data.")
-            self.statusBar().showMessage("EEPROM verification successful", 3000)
+            self.status_bar.showMessage("EEPROM verification successful", 3000)
         else:
             QMessageBox.warning(self, "Verify Failed", 
                               f"EEPROM contents don't match at address 0x{mismatch:04X}.")
-            self.statusBar().showMessage("EEPROM verification failed", 3000)
+            self.status_bar.showMessage("EEPROM verification failed", 3000)
             
     @pyqtSlot()
     def save_hex_file(self):
@@ -431,18 +528,23 @@ class MainWindow(QMainWindow):
         )
         
         if file_name:
-            from utils.hex_format import data_to_intel_hex
+            # Format and write the file on a pool thread
+            job = HexJob(file_name, data)
+            job.signals.done.connect(self.hex_file_saved)
+            job.signals.error.connect(self.hex_file_save_failed)
+            QThreadPool.globalInstance().start(job)
             
-            try:
-                with open(file_name, 'w') as f:
-                    hex_data = data_to_intel_hex(data)
-                    f.write(hex_data)
-                    
-                self.logger.info(f"Saved HEX file to {file_name}")
-                self.statusBar().showMessage(f"Saved HEX file to {file_name}", 3000)
-            except Exception as e:
-                QMessageBox.critical(self, "Save Failed", 
-                                   f"Failed to save HEX file: {str(e)}")
+    @pyqtSlot(str, object)
+    def hex_file_saved(self, file_name, _):
+        """Handle completion of a HEX file save"""
+        self.logger.info(f"Saved HEX file to {file_name}")
+        self.status_bar.showMessage(f"Saved HEX file to {file_name}", 3000)
+        
+    @pyqtSlot(str, str)
+    def hex_file_save_failed(self, file_name, error):
+        """Handle a failed HEX file save"""
+        QMessageBox.critical(self, "Save Failed", 
+                           f"Failed to save HEX file: {error}")
                 
     @pyqtSlot()
     def load_hex_file(self):
@@ -453,18 +555,23 @@ class MainWindow(QMainWindow):
         )
         
         if file_name:
-            from utils.hex_format import intel_hex_to_data
+            # Read and parse the file on a pool thread
+            job = HexJob(file_name)
+            job.signals.done.connect(self.hex_file_loaded)
+            job.signals.error.connect(self.hex_file_load_failed)
+            QThreadPool.globalInstance().start(job)
             
-            try:
-                with open(file_name, 'r') as f:
-                    hex_data = f.read()
-                    
-                data = intel_hex_to_data(hex_data)
-                self.hex_view.set_data(data)
-                self.byte_editor.set_data(data)
-                
-                self.logger.info(f"Loaded HEX file from {file_name}")
-                self.statusBar().showMessage(f"Loaded HEX file from {file_name}", 3000)
-            except Exception as e:
-                QMessageBox.critical(self, "Load Failed", 
-                                   f"Failed to load HEX file: {str(e)}")
\ No newline at end of file
+    @pyqtSlot(str, object)
+    def hex_file_loaded(self, file_name, data):
+        """Handle completion of a HEX file load"""
+        self.hex_view.set_data(data)
+        self.byte_editor.set_data(data)
+        
+        self.logger.info(f"Loaded HEX file from {file_name}")
+        self.status_bar.showMessage(f"Loaded HEX file from {file_name}", 3000)
+        
+    @pyqtSlot(str, str)
+    def hex_file_load_failed(self, file_name, error):
+        """Handle a failed HEX file load"""
+        QMessageBox.critical(self, "Load Failed", 
+                           f"Failed to load HEX file: {error}")
\ No newline at end of file
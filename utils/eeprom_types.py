@@ -24,6 +24,9 @@ EEPROM_SIZES = [
     {"name": "24C2048 (2Mbit / 256K bytes)","bits": 2097152, "bytes": 262144, "page_size": 256, "addrtype": 7},
 ]
 
+# EEPROM_SIZES entries keyed by base model (e.g. "24C32")
+EEPROM_BY_BASE = {size["name"].split()[0]: size for size in EEPROM_SIZES}
+
 # I2C speeds
 I2C_SPEEDS = [
     {"name": "20 kHz (Slowest)",      "freq": 20000},
@@ -97,3 +100,25 @@ MANUFACTURERS = {
         "devices": ["BR24L01", "BR24L02", "BR24L04", "BR24L08", "BR24L16", "BR24G32", "BR24G64", "BR24G128", "BR24G256", "BR24G512"]
     }
 }
+
+def _manufacturer_display_names(manufacturer):
+    """List the EEPROM_SIZES entries offered for a manufacturer, as combo box labels"""
+    devices = MANUFACTURERS[manufacturer]["devices"]
+    prefix = MANUFACTURERS[manufacturer]["prefix"]
+    
+    names = []
+    for size in EEPROM_SIZES:
+        # Extract base model (e.g., "24C32" from "24C32 (32Kbit / 4K bytes)")
+        base_model = size["name"].split()[0]
+        # Check if this size matches any of the manufacturer's devices
+        if any(device in base_model for device in devices):
+            # Add manufacturer prefix if needed
+            if not base_model.startswith(prefix):
+                names.append(f"{prefix}{base_model[4:]} {size['name'][6:]}")
+            else:
+                names.append(size["name"])
+    return names
+
+# EEPROM type labels per manufacturer, built once at import
+MANUFACTURER_DISPLAY_NAMES = {manufacturer: _manufacturer_display_names(manufacturer)
+                              for manufacturer in MANUFACTURERS}
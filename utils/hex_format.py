@@ -1,5 +1,7 @@
 """Intel HEX format utilities"""
 
+import binascii
+
 def data_to_intel_hex(data, bytes_per_line=16):
     """Convert binary data to Intel HEX format
     
@@ -10,37 +12,44 @@ def data_to_intel_hex(data, bytes_per_line=16):
     Returns:
         str: Intel HEX formatted string
     """
-    lines = []
+    return "\n".join(iter_intel_hex_lines(data, bytes_per_line))
+
+def iter_intel_hex_lines(data, bytes_per_line=16):
+    """Generate the Intel HEX records for binary data, one line at a time
     
+    Args:
+        data (bytes or bytearray): Binary data to convert
+        bytes_per_line (int): Number of bytes per line (default: 16)
+        
+    Yields:
+        str: Intel HEX record without line terminator, ending with the
+            end of file record
+    """
+    # Hex digits for the whole image, encoded in one pass and sliced per line
+    hex_all = binascii.hexlify(data).decode('ascii').upper()
+    
+    # Record address bytes, carried from line to line; only their sum
+    # modulo 256 matters for the checksum
+    addr_hi = addr_lo = 0
     for i in range(0, len(data), bytes_per_line):
         # Get chunk of data
         chunk = data[i:i + bytes_per_line]
         chunk_len = len(chunk)
         
-        # Calculate checksum
-        checksum = chunk_len  # Start with length byte
-        checksum += (i >> 8) & 0xFF  # High byte of address
-        checksum += i & 0xFF  # Low byte of address
-        checksum += 0  # Record type (data)
-        
-        for b in chunk:
-            checksum += b
-            
+        # Length byte + address bytes + data; the record type (data) is 0
+        checksum = chunk_len + addr_hi + addr_lo + sum(chunk)
         checksum = ((~checksum) + 1) & 0xFF  # Two's complement
         
-        # Format line
-        line = f":{chunk_len:02X}{i:04X}00"  # Start code, length, address, record type
+        addr_lo += bytes_per_line
+        if addr_lo > 0xFF:
+            addr_hi += addr_lo >> 8
+            addr_lo &= 0xFF
         
-        for b in chunk:
-            line += f"{b:02X}"
-            
-        line += f"{checksum:02X}"  # Checksum
-        lines.append(line)
+        # Start code, length, address, record type, data, checksum
+        yield f":{chunk_len:02X}{i:04X}00{hex_all[i * 2:(i + chunk_len) * 2]}{checksum:02X}"
         
     # Add end of file record
-    lines.append(":00000001FF")
-    
-    return "\n".join(lines)
+    yield ":00000001FF"
 
 def intel_hex_to_data(hex_data):
     """Convert Intel HEX format to binary data
@@ -51,9 +60,8 @@ def intel_hex_to_data(hex_data):
     Returns:
         bytearray: Binary data
     """
-    data = bytearray()
-    max_address = 0
-    
+    # First pass: decode and validate each record, collecting the data records
+    records = []
     for line in hex_data.splitlines():
         line = line.strip()
         if not line:
@@ -62,13 +70,20 @@ def intel_hex_to_data(hex_data):
         if line[0] != ':':
             raise ValueError(f"Invalid HEX line (missing start code): {line}")
             
-        # Remove start code
-        line = line[1:]
-        
-        # Parse line
-        byte_count = int(line[0:2], 16)
-        address = int(line[2:6], 16)
-        record_type = int(line[6:8], 16)
+        # Decode the whole record after the start code in one go:
+        # length, address (2), record type, data..., checksum
+        try:
+            raw = bytes.fromhex(line[1:])
+        except ValueError:
+            raise ValueError(f"Invalid HEX line (bad hex digits): {line}") from None
+        if len(raw) < 5 or len(raw) != raw[0] + 5:
+            raise ValueError(f"Invalid HEX line (length mismatch): {line}")
+        if sum(raw) & 0xFF:
+            raise ValueError(f"Invalid HEX line (checksum mismatch): {line}")
+            
+        byte_count = raw[0]
+        address = (raw[1] << 8) | raw[2]
+        record_type = raw[3]
         
         # End of file record
         if record_type == 1:
@@ -76,16 +91,14 @@ def intel_hex_to_data(hex_data):
             
         # Data record
         if record_type == 0:
-            # Make sure data array is big enough
-            if address + byte_count > max_address:
-                max_address = address + byte_count
-                if len(data) < max_address:
-                    data.extend([0xFF] * (max_address - len(data)))
-                    
-            # Extract data bytes
-            for i in range(byte_count):
-                offset = 8 + i * 2
-                byte = int(line[offset:offset + 2], 16)
-                data[address + i] = byte
-                
-    return data
\ No newline at end of file
+            records.append((address, raw[4:4 + byte_count]))
+            
+    # Allocate the image once; gaps between records read as erased (0xFF)
+    max_address = max((address + len(chunk) for address, chunk in records), default=0)
+    data = bytearray(b'\xff') * max_address
+    
+    # Second pass: copy in the data bytes
+    for address, chunk in records:
+        data[address:address + len(chunk)] = chunk
+        
+    return data
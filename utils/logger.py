@@ -1,40 +1,388 @@
 """Logger setup module"""
 
+import atexit
+import gzip
+import io
 import logging
 import os
-from datetime import datetime
+import shutil
+import socket
+import sys
+import threading
+import time
+from logging.handlers import (DatagramHandler, QueueHandler, QueueListener,
+                              SysLogHandler, TimedRotatingFileHandler)
+from queue import Queue
+
+# The log format doesn't use thread or process fields; skip collecting
+# them for every record
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
+def _env_log_level():
+    """Return the log level set by EEPROM_LOG_LEVEL (e.g. DEBUG), INFO by default"""
+    level = getattr(logging, os.environ.get("EEPROM_LOG_LEVEL", "INFO").upper(), None)
+    return level if isinstance(level, int) else logging.INFO
+
+# Debug messages from hot paths. Call sites guard debug_trace() with
+# "if LOG_TRACE_ENABLED:" so nothing is built for them unless
+# EEPROM_LOG_LEVEL=DEBUG.
+LOG_TRACE_ENABLED = _env_log_level() <= logging.DEBUG
+
+if LOG_TRACE_ENABLED:
+    def debug_trace(msg, *args):
+        """Log a hot-path message at DEBUG level"""
+        setup_logger().debug(msg, *args)
+else:
+    def debug_trace(msg, *args):
+        """Log a hot-path message; debug logging is off, so this does nothing"""
+
+class FastLogger(logging.Logger):
+    """Logger that doesn't look up the calling source line
+    
+    The log format has no filename, function or line number fields, so the
+    stack walk done for every record is skipped.
+    """
+    
+    def findCaller(self, stack_info=False, stacklevel=1):
+        return "(unknown file)", 0, "(unknown function)", None
+
+class CachedSecondFormatter(logging.Formatter):
+    """Formatter that renders the date and time part of asctime once per second"""
+    
+    def __init__(self, fmt=None, datefmt=None, style='%'):
+        super().__init__(fmt, datefmt, style)
+        self._cached = (None, "")  # (second, formatted date and time)
+        
+    def formatTime(self, record, datefmt=None):
+        sec = int(record.created)
+        cached_sec, cached_str = self._cached
+        if sec != cached_sec:
+            cached_str = time.strftime(datefmt or "%Y-%m-%d %H:%M:%S", self.converter(sec))
+            self._cached = (sec, cached_str)
+        return f"{cached_str},{int(record.msecs):03d}"
+
+class _NoLock:
+    """Handler lock that does nothing, for handlers used by a single thread"""
+    
+    def acquire(self, blocking=True, timeout=-1):
+        return True
+        
+    def release(self):
+        pass
+        
+    def __enter__(self):
+        return True
+        
+    def __exit__(self, *exc_info):
+        return False
+        
+    def _at_fork_reinit(self):
+        pass
+
+_NO_LOCK = _NoLock()
+
+# Shared by the console and file handlers; the logger name never changes,
+# so it is part of the template
+_FMT = CachedSecondFormatter('{asctime} - eeprom_programmer - {levelname} - {message}',
+                             style='{')
+
+# Append-only log file, not inherited by child processes, no newline translation
+_LOG_OPEN_FLAGS = (os.O_WRONLY | os.O_APPEND | os.O_CREAT
+                   | getattr(os, "O_CLOEXEC", 0)     # POSIX
+                   | getattr(os, "O_NOINHERIT", 0)   # Windows
+                   | getattr(os, "O_BINARY", 0))     # Windows
+
+class BatchingFileHandler(TimedRotatingFileHandler):
+    """Rotating file handler that collects encoded records and writes them in batches
+    
+    Records are appended to an in-memory buffer that is written to the file
+    with a single os.write() when it reaches FLUSH_THRESHOLD bytes, on
+    WARNING and above, every FLUSH_INTERVAL seconds, at exit, on rollover
+    and on close.
+    """
+    
+    FLUSH_THRESHOLD = 64 * 1024  # bytes
+    FLUSH_INTERVAL = 0.25  # seconds
+    
+    def __init__(self, filename, when='midnight', backupCount=0, encoding='utf-8', delay=False):
+        # The file descriptor is managed here instead of a stream
+        super().__init__(filename, when=when, backupCount=backupCount,
+                         encoding=encoding, delay=True)
+        self._fd = None
+        self._buf = bytearray()
+        self._buf_lock = threading.Lock()
+        self._stopped = threading.Event()
+        if not delay:
+            self._fd = self._open_fd()
+            
+        threading.Thread(target=self._flusher, name="eeprom_log_flush", daemon=True).start()
+        atexit.register(self.flush)
+        
+    def _open_fd(self):
+        flags = _LOG_OPEN_FLAGS | (os.O_TRUNC if 'w' in self.mode else 0)
+        return os.open(self.baseFilename, flags, 0o644)
+        
+    def _close_fd(self):
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+            
+    def _flusher(self):
+        """Write out the buffer every FLUSH_INTERVAL until closed"""
+        while not self._stopped.wait(self.FLUSH_INTERVAL):
+            try:
+                self.flush()
+            except OSError:
+                pass  # Kept in the buffer and retried on the next tick
+                
+    def _write_buffer(self):
+        """Write the buffered records to the file; the caller holds _buf_lock"""
+        if not self._buf:
+            return
+        if self._fd is None:
+            self._fd = self._open_fd()
+            
+        data = memoryview(bytes(self._buf))
+        while data:
+            data = data[os.write(self._fd, data):]
+        self._buf.clear()
+        
+    def flush(self):
+        with self._buf_lock:
+            self._write_buffer()
+            
+    def doRollover(self):
+        with self._buf_lock:
+            self._write_buffer()
+            self._close_fd()  # Windows can't rename an open file
+            super().doRollover()
+            
+    def emit(self, record):
+        try:
+            if record.created >= self.rolloverAt and self.shouldRollover(record):
+                self.doRollover()
+                
+            msg = self.format(record) + self.terminator
+            with self._buf_lock:
+                self._buf += msg.encode(self.encoding, 'replace')
+                # Don't sit on problems if the app dies
+                if len(self._buf) >= self.FLUSH_THRESHOLD or record.levelno >= logging.WARNING:
+                    self._write_buffer()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+            
+    def close(self):
+        self._stopped.set()
+        atexit.unregister(self.flush)
+        with self._buf_lock:
+            try:
+                self._write_buffer()
+            finally:
+                self._close_fd()
+        super().close()
+
+def _gzip_rotator(source, dest):
+    """Compress a rotated log file to dest and remove the original"""
+    if not os.path.exists(source):
+        return  # Nothing written since the last rollover
+    with open(source, 'rb') as src, gzip.open(dest, 'wb') as dst:
+        shutil.copyfileobj(src, dst)
+    os.remove(source)
+
+class BufferedConsoleHandler(logging.StreamHandler):
+    """Console handler that only flushes when its buffer fills or on WARNING and above
+    
+    Writes to a buffered duplicate of the stderr file descriptor, so each
+    record doesn't cost a console write. Falls back to sys.stderr itself
+    when it has no file descriptor.
+    """
+    
+    BUFFER_SIZE = 8192  # bytes
+    
+    def __init__(self):
+        stream = sys.stderr
+        try:
+            fd = os.dup(stream.fileno())
+        except (AttributeError, OSError, io.UnsupportedOperation):
+            pass  # Replaced by an IDE or test runner
+        else:
+            stream = os.fdopen(fd, 'w', buffering=self.BUFFER_SIZE,
+                               encoding=stream.encoding, errors='backslashreplace')
+        super().__init__(stream)
+        
+    def emit(self, record):
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= logging.WARNING:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+def _make_syslog_handler():
+    """Create a handler that sends records to the local syslog daemon
+    
+    Uses the /dev/log socket where available and UDP to localhost otherwise.
+    """
+    if sys.platform.startswith("linux") and os.path.exists("/dev/log"):
+        address = "/dev/log"
+    else:
+        address = ("127.0.0.1", 514)
+    handler = SysLogHandler(address=address, facility=SysLogHandler.LOG_LOCAL0)
+    handler.ident = "eeprom_programmer: "
+    # syslog adds its own timestamp and program name
+    handler.setFormatter(logging.Formatter('{levelname} - {message}', style='{'))
+    return handler
+
+class NonBlockingDatagramHandler(DatagramHandler):
+    """Handler that sends formatted records as UDP datagrams without blocking
+    
+    Each record is one line of text, which collectors such as rsyslog or
+    fluent-bit accept directly. Records that don't fit in the socket's send
+    buffer are dropped instead of stalling the caller.
+    """
+    
+    def makeSocket(self):
+        sock = super().makeSocket()
+        sock.setblocking(False)
+        return sock
+        
+    def makePickle(self, record):
+        return (self.format(record) + "\n").encode('utf-8', 'replace')
+        
+    def handleError(self, record):
+        if isinstance(sys.exc_info()[1], BlockingIOError):
+            return  # Send buffer full; drop the record
+        super().handleError(record)
+
+# Default collector for EEPROM_LOG_UDP
+LOG_UDP_ADDRESS = ("127.0.0.1", 5140)
+
+def _udp_address(value):
+    """Parse EEPROM_LOG_UDP into a resolved (ip, port) collector address
+    
+    Accepts "host:port", "host", ":port" or "1"; missing parts come from
+    LOG_UDP_ADDRESS. The host is resolved here, once, so sending a record
+    never waits on a DNS lookup.
+    
+    Raises:
+        OSError: If the host can't be resolved
+    """
+    host, port = LOG_UDP_ADDRESS
+    if value != "1":
+        name, sep, port_text = value.rpartition(":")
+        if sep and port_text.isdigit():
+            host, port = name or host, int(port_text)
+        else:
+            host = value
+    return socket.gethostbyname(host), port
+
+# Logger returned by setup_logger(), configured on the first call
+_LOGGER = None
+
+# Log file, rotated at midnight into gzip-compressed backups
+_LOG_PATH = os.path.join("logs", "eeprom_programmer.log")
+LOG_BACKUP_DAYS = 14
+
+# Set once the logs directory has been created
+_LOGS_DIR_READY = False
 
 def setup_logger():
-    """Set up and configure logger"""
-    # Create logs directory if it doesn't exist
-    logs_dir = "logs"
-    os.makedirs(logs_dir, exist_ok=True)
+    """Set up and configure logger
     
+    Only the first call configures the logger and creates the log file;
+    later calls return the same logger.
+    """
+    global _LOGGER, _LOGS_DIR_READY
+    if _LOGGER is not None:
+        return _LOGGER
+        
     # Create logger
-    logger = logging.getLogger("eeprom_programmer")
-    logger.setLevel(logging.DEBUG)
+    logger_class = logging.getLoggerClass()
+    logging.setLoggerClass(FastLogger)
+    try:
+        logger = logging.getLogger("eeprom_programmer")
+    finally:
+        logging.setLoggerClass(logger_class)
+        
+    if any(handler.name == "eeprom_queue" for handler in logger.handlers):
+        _LOGGER = logger  # Already configured
+        return logger
+        
+    # Log level for the logger and the log file (e.g. EEPROM_LOG_LEVEL=DEBUG)
+    level = _env_log_level()
+    logger.setLevel(level)
+    
+    # Create console handler; there is no stderr under pythonw
+    handlers = []
+    if sys.stderr is not None:
+        console_handler = BufferedConsoleHandler()
+        console_handler.name = "eeprom_console"
+        console_handler.level = logging.INFO
+        console_handler.formatter = _FMT
+        handlers.append(console_handler)
+    
+    # Create file handler, or hand records to syslog or a UDP collector if
+    # EEPROM_LOG_SYSLOG or EEPROM_LOG_UDP is set
+    file_handler = None
+    if os.environ.get("EEPROM_LOG_SYSLOG"):
+        try:
+            file_handler = _make_syslog_handler()
+            file_handler.name = "eeprom_syslog"
+        except OSError as e:
+            print(f"Syslog unavailable, logging to file: {e}", file=sys.stderr)
+    elif os.environ.get("EEPROM_LOG_UDP"):
+        # Hand records to an external collector that takes care of persistence
+        try:
+            file_handler = NonBlockingDatagramHandler(*_udp_address(os.environ["EEPROM_LOG_UDP"]))
+            file_handler.name = "eeprom_udp"
+            file_handler.formatter = _FMT
+        except OSError as e:
+            print(f"Log collector unavailable, logging to file: {e}", file=sys.stderr)
+        
+    if file_handler is None:
+        # Create logs directory if it doesn't exist
+        if not _LOGS_DIR_READY:
+            os.makedirs(os.path.dirname(_LOG_PATH), exist_ok=True)
+            _LOGS_DIR_READY = True
+        
+        file_handler = BatchingFileHandler(_LOG_PATH, backupCount=LOG_BACKUP_DAYS,
+                                           delay=True)  # Opened on first record
+        file_handler.name = "eeprom_file"
+        file_handler.namer = lambda name: name + ".gz"
+        file_handler.rotator = _gzip_rotator
+        file_handler.formatter = _FMT
+        
+    file_handler.level = level
+    handlers.append(file_handler)
     
-    # Remove existing handlers
-    for handler in logger.handlers[:]:
-        logger.removeHandler(handler)
+    # Only the listener thread calls these handlers, so their per-record
+    # locking is unnecessary
+    for handler in handlers:
+        handler.lock = _NO_LOCK
         
-    # Create console handler
-    console_handler = logging.StreamHandler()
-    console_handler.setLevel(logging.INFO)
+    # Callers only enqueue records; a listener thread does the console and
+    # file I/O so logging never blocks on disk writes
+    log_queue = Queue(-1)
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.name = "eeprom_queue"
     
-    # Create file handler
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    log_file = os.path.join(logs_dir, f"eeprom_programmer_{timestamp}.log")
-    file_handler = logging.FileHandler(log_file)
-    file_handler.setLevel(logging.DEBUG)
+    # Replace any existing handlers in one step, under the logging module
+    # lock, so records logged from other threads meanwhile are not lost
+    with logging._lock:
+        logger.handlers = [queue_handler]
     
-    # Create formatter
-    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-    console_handler.setFormatter(formatter)
-    file_handler.setFormatter(formatter)
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    logger._listener = listener
     
-    # Add handlers to logger
-    logger.addHandler(console_handler)
-    logger.addHandler(file_handler)
+    # Drain the queue and close the handlers on shutdown
+    atexit.register(listener.stop)
     
-    return logger
\ No newline at end of file
+    _LOGGER = logger
+    return logger
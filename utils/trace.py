@@ -0,0 +1,100 @@
+"""Low-overhead binary trace of EEPROM transfers
+
+Setting the EEPROM_TRACE environment variable records one fixed-size
+record per transfer in an in-memory ring buffer instead of going through
+the logging module. A background thread appends new records to
+logs/trace.bin every FLUSH_INTERVAL seconds. Decode the file with:
+
+    python -m utils.trace [logs/trace.bin]
+"""
+
+import atexit
+import itertools
+import mmap
+import os
+import struct
+import sys
+import threading
+import time
+
+# Record tags and the meaning of their two values
+TAG_READ = 1   # address, length
+TAG_WRITE = 2  # address, length
+TAG_RETRY = 3  # address, attempt
+TAG_NAMES = {TAG_READ: "read", TAG_WRITE: "write", TAG_RETRY: "retry"}
+
+# tag, padding, value a, value b: 12 bytes per record
+RECORD = struct.Struct("<BxxxII")
+
+RING_SIZE = 16 * 1024 * 1024  # bytes
+RING_RECORDS = RING_SIZE // RECORD.size
+FLUSH_INTERVAL = 0.5  # seconds
+TRACE_PATH = os.path.join("logs", "trace.bin")
+
+ENABLED = bool(os.environ.get("EEPROM_TRACE"))
+
+_RING = None
+_SEQ = itertools.count()  # Hands out record slots; next() is atomic
+_head = 0                 # Number of records traced
+_flushed = 0              # Number of records written to TRACE_PATH
+_flush_lock = threading.Lock()
+_fd = None
+
+def trace(tag, a, b):
+    """Record a trace event; does nothing unless EEPROM_TRACE is set"""
+    global _head
+    n = next(_SEQ)
+    RECORD.pack_into(_RING, (n % RING_RECORDS) * RECORD.size, tag, a, b)
+    _head = n + 1
+
+def _trace_disabled(tag, a, b):
+    pass
+
+def flush_ring():
+    """Append the records traced since the last flush to TRACE_PATH"""
+    global _flushed
+    with _flush_lock:
+        head = _head
+        # Records older than one ring length have been overwritten
+        start = max(_flushed, head - RING_RECORDS)
+        while start < head:
+            offset = start % RING_RECORDS
+            end = min(head, start - offset + RING_RECORDS)  # Stop at the ring's end
+            os.write(_fd, _RING[offset * RECORD.size:(offset + end - start) * RECORD.size])
+            start = end
+        _flushed = head
+
+def _flusher():
+    while True:
+        time.sleep(FLUSH_INTERVAL)
+        try:
+            flush_ring()
+        except OSError:
+            pass  # Retried on the next tick
+
+def _start():
+    """Allocate the ring buffer, open the trace file and start the flusher"""
+    global _RING, _fd
+    _RING = mmap.mmap(-1, RING_SIZE)
+    os.makedirs(os.path.dirname(TRACE_PATH), exist_ok=True)
+    _fd = os.open(TRACE_PATH, os.O_WRONLY | os.O_APPEND | os.O_CREAT
+                  | getattr(os, "O_BINARY", 0), 0o644)
+    threading.Thread(target=_flusher, name="eeprom_trace_flush", daemon=True).start()
+    atexit.register(flush_ring)
+
+def decode(path):
+    """Yield the records in a trace file as text lines"""
+    with open(path, "rb") as f:
+        data = f.read()
+    data = data[:len(data) - len(data) % RECORD.size]  # Drop a torn last record
+    for tag, a, b in RECORD.iter_unpack(data):
+        yield f"{TAG_NAMES.get(tag, tag)} 0x{a:04X} {b}"
+
+if ENABLED and __name__ != "__main__":
+    _start()
+else:
+    trace = _trace_disabled
+
+if __name__ == "__main__":
+    for line in decode(sys.argv[1] if len(sys.argv) > 1 else TRACE_PATH):
+        print(line)